@@ -21,6 +21,8 @@ class ResumeAdmin(admin.ModelAdmin):
     list_filter = (
         'created_at',
         'updated_at',
+        'experience_count',
+        'projects_count',
     )
     search_fields = (
         'title',
@@ -74,20 +76,36 @@ class ResumeAdmin(admin.ModelAdmin):
         }),
     )
     
+    # Large columns the changelist never displays.
+    changelist_deferred_fields = (
+        'summary',
+        'education',
+        'experience',
+        'projects',
+        'skills',
+    )
+
+    def get_queryset(self, request):
+        """Skip loading the JSON and text columns on the changelist."""
+        qs = super().get_queryset(request)
+        match = request.resolver_match
+        if match and match.url_name == 'builder_resume_changelist':
+            qs = qs.defer(*self.changelist_deferred_fields)
+        return qs
+
+    @admin.display(description='Section Counts', ordering='experience_count')
     def section_count_display(self, obj):
         """Display count of entries in each section."""
-        counts = obj.get_section_count()
         return format_html(
             '<strong>Education:</strong> {}<br>'
             '<strong>Experience:</strong> {}<br>'
             '<strong>Projects:</strong> {}<br>'
             '<strong>Skills:</strong> {}',
-            counts['education'],
-            counts['experience'],
-            counts['projects'],
-            counts['skills'],
+            obj.education_count,
+            obj.experience_count,
+            obj.projects_count,
+            obj.skills_count,
         )
-    section_count_display.short_description = 'Section Counts'
     
     date_hierarchy = 'updated_at'
     ordering = ('-updated_at',)
@@ -1,5 +1,16 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class BuilderConfig(AppConfig):
     name = 'builder'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+
+        # Exporters (and the PDF fonts) normally load on first use; preloading
+        # moves that cost into the parent process when workers are forked
+        # from it.
+        if settings.EXPORT_PRELOAD:
+            from .exporters import preload_exporters
+            preload_exporters()
@@ -0,0 +1,225 @@
+"""
+Write-behind buffer for autosaved resume edits.
+
+Autosave requests only merge their changed fields into a per-resume buffer
+in this process. A background thread writes a resume once no new change has
+arrived for ``AUTOSAVE_DEBOUNCE`` seconds, or at the latest
+``AUTOSAVE_MAX_DELAY`` seconds after its first buffered change, so a burst
+of dictated edits becomes a single ``save()``. Anything still buffered is
+written when the process exits normally.
+
+Views that read a resume call ``flush()`` first so they see buffered edits;
+an explicit save calls ``discard()`` because it replaces every field anyway.
+Buffered changes are dropped rather than written if the row was saved by
+anyone else after they were first buffered, so a late autosave (from another
+worker, or a request still in flight when the form was submitted) never
+overwrites a newer explicit save. A failed write is put back in the buffer
+and retried up to ``AUTOSAVE_MAX_RETRIES`` times.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+from .models import Resume
+
+logger = logging.getLogger(__name__)
+
+
+class AutosaveBuffer:
+    """Pending field changes per resume, flushed by a background thread."""
+
+    def __init__(self):
+        self._pending = {}
+        self._first_change = {}
+        self._last_change = {}
+        # Wall-clock time each resume's changes were first buffered, compared
+        # with the row's ``updated_at`` before writing.
+        self._buffered_at = {}
+        self._attempts = {}
+        # ``updated_at`` of the last row this buffer wrote, so its own writes
+        # don't make later changes look stale.
+        self._written_at = {}
+        self._cond = threading.Condition()
+        # One lock per resume, held while writing so discard() can wait out an
+        # in-flight flush without blocking writes to other resumes. Entries
+        # are [lock, users] and are removed with the last user.
+        self._locks = {}
+        self._thread = None
+        self._atexit_registered = False
+
+    def submit(self, resume_id, changes):
+        """Merge changed fields into the buffer for a resume."""
+        now = time.monotonic()
+        with self._cond:
+            self._pending.setdefault(resume_id, {}).update(changes)
+            self._first_change.setdefault(resume_id, now)
+            self._last_change[resume_id] = now
+            self._buffered_at.setdefault(resume_id, timezone.now())
+            self._ensure_thread()
+            self._cond.notify()
+
+    def has_pending(self, resume_id):
+        with self._cond:
+            return resume_id in self._pending
+
+    def flush(self, resume_id):
+        """
+        Write any buffered changes for a resume now.
+
+        Returns:
+            True if changes were written to the database, otherwise False
+        """
+        if not self.has_pending(resume_id):
+            return False
+        with self._locked(resume_id):
+            taken = self._take(resume_id)
+            if taken is None:
+                return False
+            return self._write(resume_id, *taken)
+
+    def flush_all(self):
+        """Write every buffered resume now."""
+        with self._cond:
+            resume_ids = list(self._pending)
+        for resume_id in resume_ids:
+            self.flush(resume_id)
+
+    def discard(self, resume_id):
+        """Drop buffered changes, waiting for any write already in progress."""
+        with self._locked(resume_id):
+            self._take(resume_id)
+            with self._cond:
+                self._attempts.pop(resume_id, None)
+
+    @contextmanager
+    def _locked(self, resume_id):
+        """Hold the resume's lock; forget its per-resume state once idle."""
+        with self._cond:
+            entry = self._locks.setdefault(resume_id, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._cond:
+                entry[1] -= 1
+                if not entry[1] and resume_id not in self._pending:
+                    # Changes buffered from now on are newer than any write
+                    # this buffer made, so its write times are no longer needed.
+                    del self._locks[resume_id]
+                    self._written_at.pop(resume_id, None)
+
+    def _take(self, resume_id):
+        with self._cond:
+            changes = self._pending.pop(resume_id, None)
+            self._first_change.pop(resume_id, None)
+            self._last_change.pop(resume_id, None)
+            buffered_at = self._buffered_at.pop(resume_id, None)
+            if changes is None:
+                return None
+            return changes, buffered_at
+
+    def _requeue(self, resume_id, changes, buffered_at):
+        """Put changes from a failed write back, under any newer ones."""
+        now = time.monotonic()
+        with self._cond:
+            attempts = self._attempts.get(resume_id, 0) + 1
+            if attempts > getattr(settings, "AUTOSAVE_MAX_RETRIES", 5):
+                self._attempts.pop(resume_id, None)
+                logger.error(
+                    "Giving up on autosave for resume %s after %d attempts",
+                    resume_id, attempts - 1,
+                )
+                return
+            self._attempts[resume_id] = attempts
+            self._pending[resume_id] = {**changes, **self._pending.get(resume_id, {})}
+            self._first_change.setdefault(resume_id, now)
+            # Counts as a fresh change, so the retry waits one debounce period.
+            self._last_change[resume_id] = now
+            self._buffered_at[resume_id] = min(
+                buffered_at, self._buffered_at.get(resume_id, buffered_at)
+            )
+            self._cond.notify()
+
+    def _write(self, resume_id, changes, buffered_at):
+        try:
+            close_old_connections()
+            resume = Resume.objects.get(id=resume_id)
+            if (
+                resume.updated_at > buffered_at
+                and resume.updated_at != self._written_at.get(resume_id)
+            ):
+                logger.info(
+                    "Dropped stale autosave for resume %s: saved at %s, buffered at %s",
+                    resume_id, resume.updated_at, buffered_at,
+                )
+                return False
+            for field, value in changes.items():
+                setattr(resume, field, value)
+            resume.save(update_fields=[*changes, "updated_at"])
+        except Resume.DoesNotExist:
+            return False
+        except Exception as e:
+            logger.error("Error autosaving resume %s, will retry: %s", resume_id, e)
+            self._requeue(resume_id, changes, buffered_at)
+            return False
+        with self._cond:
+            self._written_at[resume_id] = resume.updated_at
+            self._attempts.pop(resume_id, None)
+        logger.info("Autosaved %d fields for resume %s", len(changes), resume_id)
+        return True
+
+    def _due(self, now):
+        """Return resume ids ready to flush and seconds until the next one is."""
+        debounce = getattr(settings, "AUTOSAVE_DEBOUNCE", 2.0)
+        max_delay = getattr(settings, "AUTOSAVE_MAX_DELAY", 15.0)
+        due, wait = [], None
+        for resume_id in self._pending:
+            if self._attempts.get(resume_id):
+                # Retries only wait out the debounce, not the max delay.
+                flush_at = self._last_change[resume_id] + debounce
+            else:
+                flush_at = min(
+                    self._last_change[resume_id] + debounce,
+                    self._first_change[resume_id] + max_delay,
+                )
+            if flush_at <= now:
+                due.append(resume_id)
+            elif wait is None or flush_at - now < wait:
+                wait = flush_at - now
+        return due, wait
+
+    def _run(self):
+        while True:
+            try:
+                with self._cond:
+                    due, wait = self._due(time.monotonic())
+                    while not due:
+                        self._cond.wait(timeout=wait)
+                        due, wait = self._due(time.monotonic())
+                for resume_id in due:
+                    self.flush(resume_id)
+            except Exception:
+                logger.exception("Autosave flusher failed, continuing")
+                time.sleep(1)
+
+    def _ensure_thread(self):
+        # Called with self._cond held.
+        if self._thread is None or not self._thread.is_alive():
+            if self._thread is not None:
+                logger.warning("Autosave flusher thread died, restarting it")
+            self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+            self._thread.start()
+        if not self._atexit_registered:
+            atexit.register(self.flush_all)
+            self._atexit_registered = True
+
+
+buffer = AutosaveBuffer()
@@ -0,0 +1,54 @@
+"""
+Registry of resume export formats.
+
+Each format maps to a backend module that defines ``CONTENT_TYPE``,
+``EXTENSION`` and ``render(resume) -> bytes``. Backends are imported on first
+use, so processes that never export (management commands, workers that
+only serve pages) don't load ReportLab or python-docx. Set
+``EXPORT_PRELOAD`` to import them all when the app loads instead, e.g. in a
+gunicorn master started with ``--preload`` so forked workers inherit them.
+
+Extra formats can be added with the ``EXPORT_BACKENDS`` setting.
+"""
+
+import importlib
+import threading
+
+from django.conf import settings
+
+DEFAULT_BACKENDS = {
+    "pdf": "builder.exporters.pdf",
+    "docx": "builder.exporters.docx",
+}
+
+_loaded = {}
+_lock = threading.Lock()
+
+
+def get_backends():
+    """Return the format -> module path mapping."""
+    return {**DEFAULT_BACKENDS, **getattr(settings, "EXPORT_BACKENDS", {})}
+
+
+def get_exporter(fmt):
+    """
+    Return the backend module for an export format, importing it if needed.
+
+    Raises:
+        KeyError: If no backend is registered for the format.
+    """
+    exporter = _loaded.get(fmt)
+    if exporter is None:
+        module_path = get_backends()[fmt]
+        with _lock:
+            exporter = _loaded.get(fmt)
+            if exporter is None:
+                exporter = importlib.import_module(module_path)
+                _loaded[fmt] = exporter
+    return exporter
+
+
+def preload_exporters():
+    """Import every registered backend now."""
+    for fmt in get_backends():
+        get_exporter(fmt)
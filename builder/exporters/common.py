@@ -0,0 +1,49 @@
+"""
+Text helpers shared by the exporter backends.
+"""
+
+
+def get_contact_line(resume):
+    """Build contact line from email, phone, location."""
+    parts = [resume.email, resume.phone, resume.location]
+    return " | ".join([x for x in parts if x])
+
+
+def get_links_line(resume):
+    """Build links line from LinkedIn and GitHub."""
+    parts = [resume.linkedin, resume.github]
+    return " | ".join([x for x in parts if x])
+
+
+def wrap_text(text, width=95):
+    """
+    Wrap text to specified width, splitting on word boundaries.
+    
+    Args:
+        text: Text to wrap
+        width: Maximum line width
+        
+    Returns:
+        List of wrapped lines
+    """
+    words = (text or "").split()
+    lines, current_line = [], []
+    current_width = 0
+    
+    for word in words:
+        word_len = len(word)
+        space_len = 1 if current_line else 0
+        
+        if current_width + space_len + word_len <= width:
+            current_line.append(word)
+            current_width += space_len + word_len
+        else:
+            if current_line:
+                lines.append(" ".join(current_line))
+            current_line = [word]
+            current_width = word_len
+    
+    if current_line:
+        lines.append(" ".join(current_line))
+    
+    return lines
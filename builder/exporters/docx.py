@@ -0,0 +1,85 @@
+"""
+DOCX exporter backend (python-docx).
+"""
+
+import io
+
+from docx import Document
+
+from .common import get_contact_line, get_links_line
+
+CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+EXTENSION = "docx"
+
+
+def render(resume):
+    """Render the resume as DOCX and return the file contents."""
+    doc = Document()
+    doc.add_heading(resume.full_name or "Unnamed", level=0)
+
+    # Contact info
+    contact = get_contact_line(resume)
+    if contact:
+        doc.add_paragraph(contact)
+
+    # Links
+    links = get_links_line(resume)
+    if links:
+        doc.add_paragraph(links)
+
+    # Summary
+    if resume.summary:
+        doc.add_heading("Summary", level=1)
+        doc.add_paragraph(resume.summary)
+
+    # Education
+    if resume.education:
+        doc.add_heading("Education", level=1)
+        for edu in resume.education:
+            degree = edu.get("degree", "")
+            institution = edu.get("institution", "")
+            dates = edu.get("dates", "")
+            details = edu.get("details", "")
+
+            title = " — ".join([x for x in [degree, institution, dates] if x])
+            doc.add_paragraph(title, style="List Bullet")
+
+            if details:
+                doc.add_paragraph(details)
+
+    # Experience
+    if resume.experience:
+        doc.add_heading("Experience", level=1)
+        for exp in resume.experience:
+            role = exp.get("role", "")
+            company = exp.get("company", "")
+            dates = exp.get("dates", "")
+
+            title = " — ".join([x for x in [role, company, dates] if x])
+            doc.add_paragraph(title, style="List Bullet")
+
+            for bullet in (exp.get("bullets") or []):
+                doc.add_paragraph(bullet, style="List Bullet 2")
+
+    # Projects
+    if resume.projects:
+        doc.add_heading("Projects", level=1)
+        for proj in resume.projects:
+            name = proj.get("name", "")
+            tech = proj.get("tech", "")
+
+            title = " — ".join([x for x in [name, tech] if x])
+            doc.add_paragraph(title, style="List Bullet")
+
+            for bullet in (proj.get("bullets") or []):
+                doc.add_paragraph(bullet, style="List Bullet 2")
+
+    # Skills
+    if resume.skills:
+        doc.add_heading("Skills", level=1)
+        skills_text = ", ".join([s for s in resume.skills if isinstance(s, str)])
+        doc.add_paragraph(skills_text)
+
+    f = io.BytesIO()
+    doc.save(f)
+    return f.getvalue()
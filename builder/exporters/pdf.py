@@ -0,0 +1,116 @@
+"""
+PDF exporter backend (ReportLab).
+
+Importing this module also loads the export fonts, so the first PDF export in
+a process, or ``preload_exporters()``, pays the font parsing cost once.
+"""
+
+import io
+
+from reportlab.lib.pagesizes import LETTER
+from reportlab.pdfgen import canvas
+
+from ..pdf_fonts import load_export_fonts, registry as font_registry
+from .common import get_contact_line, get_links_line, wrap_text
+
+CONTENT_TYPE = "application/pdf"
+EXTENSION = "pdf"
+
+load_export_fonts()
+
+
+def render(resume):
+    """Render the resume as PDF and return the file contents."""
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=LETTER)
+    width, height = LETTER
+    y = height - 50
+
+    def write_line(text, size=11, gap=16):
+        """Write a line of text to the PDF."""
+        nonlocal y
+        # Truncate long text to avoid overflow
+        display_text = (text or "")[:120]
+        c.setFont(font_registry.font_for(display_text), size)
+        c.drawString(50, y, display_text)
+        y -= gap
+        if y < 60:
+            c.showPage()
+            y = height - 50
+
+    # Header: Name
+    write_line(resume.full_name or "Unnamed", size=16, gap=22)
+
+    # Contact info
+    contact = get_contact_line(resume)
+    if contact:
+        write_line(contact, size=10, gap=14)
+
+    # Links
+    links = get_links_line(resume)
+    if links:
+        write_line(links, size=10, gap=14)
+
+    # Summary
+    if resume.summary:
+        write_line("")
+        write_line("SUMMARY", size=12, gap=18)
+        for chunk in wrap_text(resume.summary, 95):
+            write_line(chunk, size=10, gap=14)
+
+    # Education
+    if resume.education:
+        write_line("")
+        write_line("EDUCATION", size=12, gap=18)
+        for edu in resume.education:
+            degree = edu.get("degree", "")
+            institution = edu.get("institution", "")
+            dates = edu.get("dates", "")
+            details = edu.get("details", "")
+
+            title = " — ".join([x for x in [degree, institution] if x])
+            write_line(f"{title}  {dates}".strip(), size=10, gap=14)
+
+            if details:
+                for chunk in wrap_text(details, 95):
+                    write_line(f"  • {chunk}", size=10, gap=14)
+
+    # Experience
+    if resume.experience:
+        write_line("")
+        write_line("EXPERIENCE", size=12, gap=18)
+        for exp in resume.experience:
+            role = exp.get("role", "")
+            company = exp.get("company", "")
+            dates = exp.get("dates", "")
+
+            title = " — ".join([x for x in [role, company] if x])
+            write_line(f"{title}  {dates}".strip(), size=10, gap=14)
+
+            for bullet in (exp.get("bullets") or []):
+                for chunk in wrap_text(bullet, 95):
+                    write_line(f"  • {chunk}", size=10, gap=14)
+
+    # Projects
+    if resume.projects:
+        write_line("")
+        write_line("PROJECTS", size=12, gap=18)
+        for proj in resume.projects:
+            name = proj.get("name", "Project")
+            tech = proj.get("tech", "")
+
+            write_line(f"{name}  {tech}".strip(), size=10, gap=14)
+
+            for bullet in (proj.get("bullets") or []):
+                for chunk in wrap_text(bullet, 95):
+                    write_line(f"  • {chunk}", size=10, gap=14)
+
+    # Skills
+    if resume.skills:
+        write_line("")
+        write_line("SKILLS", size=12, gap=18)
+        skills_text = ", ".join([s for s in resume.skills if isinstance(s, str)])
+        write_line(skills_text[:110], size=10, gap=14)
+
+    c.save()
+    return buffer.getvalue()
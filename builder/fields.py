@@ -0,0 +1,114 @@
+"""
+Model fields that store large resume text and JSON compressed.
+
+Values are written to a binary column with a one-byte header describing the
+encoding. Short values are kept as plain UTF-8, longer ones are zlib
+compressed against a preset dictionary of common resume vocabulary so even
+mid-sized JSON sections shrink well. The Python-side API is unchanged: a
+CompressedTextField still holds a ``str`` and a CompressedJSONField still
+holds lists and dicts.
+"""
+
+import zlib
+
+from django.conf import settings
+from django.db import models
+
+# Header bytes. Never reuse or renumber these; stored rows depend on them.
+PLAIN = b"\x00"
+ZLIB = b"\x01"
+ZLIB_RESUME_DICT_V1 = b"\x02"
+
+DEFAULT_COMPRESS_THRESHOLD = 256
+
+# Preset dictionary for ZLIB_RESUME_DICT_V1. zlib matches against the end of
+# the dictionary first, so the most frequent strings come last. Changing this
+# would make existing rows unreadable; add a new header version instead.
+RESUME_ZDICT_V1 = (
+    "University College Institute School of Technology Engineering "
+    "Bachelor Master Science Computer Information Systems GPA Honors "
+    "Python JavaScript TypeScript Java React Django Node.js SQL PostgreSQL "
+    "Docker Kubernetes AWS Git REST API machine learning data analysis "
+    "Developed Designed Implemented Built Led Managed Improved Reduced "
+    "Increased Created Collaborated with the team to using and for of in "
+    "Software Engineer Developer Intern Senior Manager Analyst Present "
+    '"details": "", "dates": "", "institution": "", "degree": "'
+    '"tech": "", "name": "", "bullets": ["", "company": "", "role": "'
+).encode("utf-8")
+
+
+def _compress_threshold(field):
+    if field.compress_threshold is not None:
+        return field.compress_threshold
+    return getattr(settings, "RESUME_COMPRESS_THRESHOLD", DEFAULT_COMPRESS_THRESHOLD)
+
+
+def compress_text(text, threshold=DEFAULT_COMPRESS_THRESHOLD):
+    """Encode text for storage, compressing only when it is worth it."""
+    raw = text.encode("utf-8")
+    if len(raw) < threshold:
+        return PLAIN + raw
+    compressor = zlib.compressobj(level=6, zdict=RESUME_ZDICT_V1)
+    packed = compressor.compress(raw) + compressor.flush()
+    if len(packed) >= len(raw):
+        return PLAIN + raw
+    return ZLIB_RESUME_DICT_V1 + packed
+
+
+def decompress_text(value):
+    """Decode a stored value back to text."""
+    if isinstance(value, str):
+        # Rows written before the column was converted are still plain text.
+        return value
+    value = bytes(value)
+    header, body = value[:1], value[1:]
+    if header == PLAIN:
+        return body.decode("utf-8")
+    if header == ZLIB:
+        return zlib.decompress(body).decode("utf-8")
+    if header == ZLIB_RESUME_DICT_V1:
+        decompressor = zlib.decompressobj(zdict=RESUME_ZDICT_V1)
+        return (decompressor.decompress(body) + decompressor.flush()).decode("utf-8")
+    raise ValueError(f"Unknown compressed field header: {header!r}")
+
+
+class CompressedFieldMixin:
+    """Store the parent field's text representation compressed in a blob column."""
+
+    def __init__(self, *args, compress_threshold=None, **kwargs):
+        self.compress_threshold = compress_threshold
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.compress_threshold is not None:
+            kwargs["compress_threshold"] = self.compress_threshold
+        return name, path, args, kwargs
+
+    def get_internal_type(self):
+        return "BinaryField"
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        value = super().get_db_prep_value(value, connection, prepared)
+        if isinstance(value, str):
+            return connection.Database.Binary(
+                compress_text(value, _compress_threshold(self))
+            )
+        return value
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        text = decompress_text(value)
+        parent = getattr(super(), "from_db_value", None)
+        if parent is not None:
+            return parent(text, expression, connection)
+        return text
+
+
+class CompressedTextField(CompressedFieldMixin, models.TextField):
+    """TextField stored compressed."""
+
+
+class CompressedJSONField(CompressedFieldMixin, models.JSONField):
+    """JSONField stored compressed. JSON key lookups are not supported."""
@@ -0,0 +1,243 @@
+"""
+Mixed-workload load generator for the builder app.
+
+Virtual users run in threads, each with its own keep-alive HTTP connection
+and CSRF cookie, and pick a route for every request according to the
+configured mix. Results are collected per route and summarized as
+throughput, latency percentiles and error rates. Driven by the ``loadtest``
+management command.
+"""
+
+import http.client
+import json
+import random
+import re
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from http.cookies import SimpleCookie
+from urllib.parse import urlencode, urlsplit
+
+from django.urls import reverse
+
+from .models import Resume
+
+SEED_TITLE = "[loadtest] Resume"
+
+DEFAULT_MIX = {"home": 40, "edit": 25, "preview": 20, "pdf": 10, "docx": 5}
+
+CSRF_INPUT_RE = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+
+
+def parse_mix(raw):
+    """Parse ``home=40,edit=25,...`` into a route -> weight mapping."""
+    mix = {}
+    for part in raw.split(","):
+        route, _, weight = part.partition("=")
+        route = route.strip()
+        if route not in DEFAULT_MIX:
+            raise ValueError(f"Unknown route '{route}'. Choose from: {', '.join(DEFAULT_MIX)}")
+        mix[route] = float(weight)
+    if not any(mix.values()):
+        raise ValueError("At least one route needs a positive weight")
+    return mix
+
+
+def seed_resumes(count, using="default"):
+    """Create ``count`` resumes of varying size in database ``using`` and return their ids."""
+    resumes = []
+    for i in range(count):
+        size = 1 + i % 5
+        resumes.append(Resume(
+            title=SEED_TITLE,
+            full_name=f"Load Test {i}",
+            email=f"loadtest{i}@example.com",
+            phone="+1 555 0100",
+            summary="Engineer focused on reliable web services. " * size,
+            education=[{"degree": "B.S. Computer Science", "institution": "State University",
+                        "dates": "2014–2018", "details": "GPA 3.7"}],
+            experience=[{"role": "Software Engineer", "company": f"Company {j}", "dates": "2018–2022",
+                         "bullets": ["Built and operated Django services"] * size}
+                        for j in range(size)],
+            projects=[{"name": f"Project {j}", "tech": "Python, Django",
+                       "bullets": ["Designed the data model"] * size} for j in range(size)],
+            skills=["Python", "Django", "SQL", "Docker"] * size,
+        ))
+    for resume in resumes:
+        # save() rather than bulk_create so section counts are filled in.
+        resume.save(using=using)
+    return [resume.id for resume in resumes]
+
+
+def delete_seeded(using="default"):
+    """Remove resumes created by ``seed_resumes``."""
+    return Resume.objects.using(using).filter(title=SEED_TITLE).delete()[0]
+
+
+@dataclass
+class RouteStats:
+    latencies: list = field(default_factory=list)
+    statuses: dict = field(default_factory=lambda: defaultdict(int))
+    errors: int = 0
+
+
+class VirtualUser:
+    """One simulated client with a persistent connection and cookies."""
+
+    def __init__(self, base_url, resume_ids, mix, rng):
+        parts = urlsplit(base_url)
+        self.host = parts.netloc
+        self.prefix = parts.path.rstrip("/")
+        self.resume_ids = resume_ids
+        self.routes = list(mix)
+        self.weights = list(mix.values())
+        self.rng = rng
+        self.cookies = SimpleCookie()
+        self.conn = None
+
+    def _request(self, method, path, body=None, headers=None):
+        headers = dict(headers or {})
+        if self.cookies:
+            headers["Cookie"] = "; ".join(f"{k}={m.value}" for k, m in self.cookies.items())
+        for attempt in range(2):
+            if self.conn is None:
+                self.conn = http.client.HTTPConnection(self.host, timeout=60)
+            try:
+                self.conn.request(method, self.prefix + path, body=body, headers=headers)
+                response = self.conn.getresponse()
+                data = response.read()
+                break
+            except (http.client.HTTPException, ConnectionError):
+                # Server closed the keep-alive connection; retry once on a new one.
+                self.conn.close()
+                self.conn = None
+                if attempt:
+                    raise
+        for cookie in response.headers.get_all("Set-Cookie") or []:
+            self.cookies.load(cookie)
+        return response.status, data
+
+    def run_one(self):
+        """Issue one request for a randomly chosen route; return (route, status, seconds)."""
+        route = self.rng.choices(self.routes, self.weights)[0]
+        resume_id = self.rng.choice(self.resume_ids)
+        start = time.perf_counter()
+        if route == "home":
+            status, _ = self._request("GET", reverse("home"))
+        elif route == "preview":
+            status, _ = self._request("GET", reverse("resume_preview", args=[resume_id]))
+        elif route in ("pdf", "docx"):
+            status, _ = self._request("GET", reverse(f"export_{route}", args=[resume_id]))
+        else:
+            status = self._edit(resume_id)
+        return route, status, time.perf_counter() - start
+
+    def _edit(self, resume_id):
+        """Load the edit page, then save it with JSON sections, as the browser does."""
+        path = reverse("resume_edit", args=[resume_id])
+        status, page = self._request("GET", path)
+        match = CSRF_INPUT_RE.search(page.decode("utf-8", "replace"))
+        if status != 200 or not match:
+            return status
+        n = self.rng.randint(1, 4)
+        form = {
+            "csrfmiddlewaretoken": match.group(1),
+            "title": SEED_TITLE,
+            "full_name": f"Load Test {resume_id}",
+            "email": f"loadtest{resume_id}@example.com",
+            "phone": "+1 555 0100",
+            "summary": "Updated during load test. " * n,
+            "education_json": json.dumps([{"degree": "B.S.", "institution": "State University"}]),
+            "experience_json": json.dumps([{"role": "Engineer", "company": "Acme",
+                                            "bullets": ["Shipped features"] * n}]),
+            "projects_json": json.dumps([{"name": "Project", "bullets": ["Built it"] * n}]),
+            "skills_json": json.dumps(["Python", "Django"] * n),
+        }
+        status, _ = self._request(
+            "POST", path, body=urlencode(form),
+            headers={"Content-Type": "application/x-www-form-urlencoded",
+                     "Referer": f"http://{self.host}{self.prefix}{path}"},
+        )
+        return status
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+
+
+def run_load(base_url, resume_ids, mix, concurrency, duration, seed=None):
+    """
+    Drive the app with ``concurrency`` virtual users for ``duration`` seconds.
+
+    Returns:
+        (stats per route, elapsed seconds)
+    """
+    stats = defaultdict(RouteStats)
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+    master_rng = random.Random(seed)
+
+    def worker(rng):
+        user = VirtualUser(base_url, resume_ids, mix, rng)
+        try:
+            while time.perf_counter() < deadline:
+                try:
+                    route, status, seconds = user.run_one()
+                except Exception:
+                    with lock:
+                        stats["(connection)"].errors += 1
+                    continue
+                with lock:
+                    route_stats = stats[route]
+                    route_stats.latencies.append(seconds)
+                    route_stats.statuses[status] += 1
+                    if status >= 400:
+                        route_stats.errors += 1
+        finally:
+            user.close()
+
+    threads = [
+        threading.Thread(target=worker, args=(random.Random(master_rng.random()),), daemon=True)
+        for _ in range(concurrency)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return dict(stats), time.perf_counter() - start
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def format_report(stats, elapsed):
+    """Render the per-route summary table as lines of text."""
+    header = f"{'route':<14}{'reqs':>7}{'req/s':>9}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'max ms':>9}{'err %':>8}  statuses"
+    lines = [header, "-" * len(header)]
+    total = total_errors = 0
+    for route in sorted(stats):
+        s = stats[route]
+        latencies = sorted(s.latencies)
+        count = len(latencies)
+        total += count
+        total_errors += s.errors
+        error_pct = 100 * s.errors / max(count, s.errors, 1)
+        statuses = " ".join(f"{code}:{n}" for code, n in sorted(s.statuses.items()))
+        lines.append(
+            f"{route:<14}{count:>7}{count / elapsed:>9.1f}"
+            f"{_percentile(latencies, 50) * 1000:>9.1f}{_percentile(latencies, 90) * 1000:>9.1f}"
+            f"{_percentile(latencies, 99) * 1000:>9.1f}{(latencies[-1] if latencies else 0) * 1000:>9.1f}"
+            f"{error_pct:>8.1f}  {statuses}"
+        )
+    lines.append("-" * len(header))
+    lines.append(
+        f"{'total':<14}{total:>7}{total / elapsed:>9.1f}"
+        f"  in {elapsed:.1f}s, {total_errors} errors"
+    )
+    return lines
@@ -0,0 +1,38 @@
+"""
+Management command to render several resumes into one PDF packet.
+
+Usage:
+    python manage.py export_packet 3 7 12 --output shortlist.pdf
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from builder.models import Resume
+from builder.packets import render_packet
+
+
+class Command(BaseCommand):
+    help = 'Render a list of resumes into a single PDF with one bookmark per resume'
+
+    def add_arguments(self, parser):
+        parser.add_argument('resume_ids', nargs='+', type=int, help='Resume ids, in packet order')
+        parser.add_argument(
+            '--output',
+            default='resume_packet.pdf',
+            help='Path of the PDF file to write',
+        )
+
+    def handle(self, *args, **options):
+        """Render the requested resumes and write the merged PDF."""
+        ids = list(dict.fromkeys(options['resume_ids']))
+        found = Resume.objects.in_bulk(ids)
+        missing = [resume_id for resume_id in ids if resume_id not in found]
+        if missing:
+            raise CommandError(f"Resumes not found: {', '.join(map(str, missing))}")
+
+        with open(options['output'], 'wb') as out:
+            render_packet([found[resume_id] for resume_id in ids], out)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Wrote {len(ids)} resumes to {options['output']}")
+        )
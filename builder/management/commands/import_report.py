@@ -0,0 +1,89 @@
+"""
+Management command to report how long the export backends take to import.
+
+Each measurement runs in a fresh interpreter so nothing is already cached.
+A backend's time includes whatever it loads on import, such as the PDF fonts.
+
+Usage:
+    python manage.py import_report
+    python manage.py import_report --top 5
+"""
+
+import os
+import subprocess
+import sys
+
+from django.core.management.base import BaseCommand
+
+from builder.exporters import get_backends
+
+MARKER = "--import-report-start--"
+
+SCRIPT = """
+import importlib, sys, time
+import django
+t0 = time.perf_counter()
+django.setup()
+t1 = time.perf_counter()
+print({marker!r}, file=sys.stderr, flush=True)
+if {module!r}:
+    importlib.import_module({module!r})
+t2 = time.perf_counter()
+print(t1 - t0, t2 - t1)
+"""
+
+
+def _measure(module_path):
+    """Return (setup seconds, import seconds, importtime lines) for a backend."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+         SCRIPT.format(marker=MARKER, module=module_path)],
+        capture_output=True,
+        text=True,
+        # Preloading would move the backend cost into django.setup().
+        env={**os.environ, "EXPORT_PRELOAD": "False"},
+        check=True,
+    )
+    setup_time, import_time = (float(x) for x in result.stdout.split())
+    _, _, after_marker = result.stderr.partition(MARKER)
+    return setup_time, import_time, after_marker.splitlines()
+
+
+def _top_level_imports(lines, top):
+    """Pick the slowest top-level modules from -X importtime output."""
+    entries = []
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        cumulative_us = cumulative_us.strip()
+        # Nested imports are indented under the module that triggered them.
+        if not cumulative_us.isdigit() or name.startswith("  "):
+            continue
+        entries.append((int(cumulative_us), name.strip()))
+    return sorted(entries, reverse=True)[:top]
+
+
+class Command(BaseCommand):
+    help = 'Report the import cost of each export backend'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=3,
+            help='Number of slowest modules to list per backend',
+        )
+
+    def handle(self, *args, **options):
+        """Measure django.setup() and each backend import in a fresh process."""
+        setup_time, _, _ = _measure("")
+        self.stdout.write(f"django.setup(): {setup_time * 1000:.1f} ms")
+
+        for fmt, module_path in get_backends().items():
+            _, import_time, lines = _measure(module_path)
+            self.stdout.write(
+                self.style.SUCCESS(f"{fmt} ({module_path}): {import_time * 1000:.1f} ms")
+            )
+            for cumulative_us, name in _top_level_imports(lines, options['top']):
+                self.stdout.write(f"    {cumulative_us / 1000:8.1f} ms  {name}")
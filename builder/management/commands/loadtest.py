@@ -0,0 +1,127 @@
+"""
+Management command to run a mixed-workload load test against the builder app.
+
+Seeds load-test resumes into the database named by --database (or uses the
+existing resumes given with --resume-ids), then drives the real URL routes
+(home, edit + save, preview, PDF/DOCX export) at the requested concurrency
+and prints throughput, latency percentiles and error rates per route. The
+edit route saves over the resumes it visits, so seeding is never implied:
+one of the two options is required. Without --url an in-process threaded
+WSGI server is started with the export rate limit disabled; point --url at
+gunicorn/uvicorn to compare deployments, and set EXPORT_RATE_LIMIT=0 there
+unless the limit itself is what you want to measure.
+
+Usage:
+    python manage.py loadtest --database default --concurrency 16 --duration 30
+    python manage.py loadtest --url http://127.0.0.1:8000 --resume-ids 1,2,3 --mix home=50,edit=30,pdf=20
+"""
+
+import threading
+from contextlib import nullcontext
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.servers.basehttp import ThreadedWSGIServer, WSGIRequestHandler
+from django.core.wsgi import get_wsgi_application
+from django.db import connections
+from django.test.utils import override_settings
+
+from builder.loadtest import (
+    DEFAULT_MIX,
+    delete_seeded,
+    format_report,
+    parse_mix,
+    run_load,
+    seed_resumes,
+)
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class Command(BaseCommand):
+    help = 'Drive the builder routes with a configurable mix of requests and report latency'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', help='Base URL of a running server (default: start one in-process)')
+        parser.add_argument('--concurrency', type=int, default=8, help='Number of virtual users')
+        parser.add_argument('--duration', type=float, default=30, help='Seconds to run')
+        parser.add_argument(
+            '--mix',
+            default=','.join(f'{route}={weight}' for route, weight in DEFAULT_MIX.items()),
+            help='Route weights, e.g. home=40,edit=25,preview=20,pdf=10,docx=5',
+        )
+        parser.add_argument(
+            '--database',
+            help='Database alias to seed load-test resumes into; the server under test must use it',
+        )
+        parser.add_argument(
+            '--resume-ids',
+            help='Comma-separated ids of existing resumes to use instead of seeding (they get edited)',
+        )
+        parser.add_argument('--resumes', type=int, default=20, help='Number of resumes to seed')
+        parser.add_argument('--keep', action='store_true', help='Keep the seeded resumes afterwards')
+        parser.add_argument('--random-seed', type=int, help='Seed for the request sequence')
+
+    def handle(self, *args, **options):
+        """Seed data, run the workload and print the report."""
+        try:
+            mix = parse_mix(options['mix'])
+        except ValueError as e:
+            raise CommandError(e)
+
+        database = options['database']
+        if options['resume_ids']:
+            try:
+                resume_ids = [int(part) for part in options['resume_ids'].split(',') if part.strip()]
+            except ValueError:
+                raise CommandError('--resume-ids must be comma-separated integers')
+            database = None
+        elif database:
+            if database not in connections:
+                raise CommandError(f'Unknown database alias "{database}"')
+            self.stdout.write(
+                f"Seeding {options['resumes']} resumes into "
+                f"{connections[database].settings_dict['NAME']}"
+            )
+            resume_ids = seed_resumes(options['resumes'], using=database)
+        else:
+            raise CommandError(
+                'Pass --database <alias> to seed load-test resumes into that database, '
+                'or --resume-ids to use existing ones'
+            )
+
+        server = None
+        base_url = options['url']
+        # The in-process server shares these settings; measuring it through
+        # the per-client export rate limit would only measure 429s.
+        settings_override = nullcontext() if base_url else override_settings(EXPORT_RATE_LIMIT=0)
+        if not base_url:
+            server = ThreadedWSGIServer(('127.0.0.1', 0), QuietRequestHandler)
+            server.set_app(get_wsgi_application())
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            base_url = f'http://127.0.0.1:{server.server_port}'
+
+        self.stdout.write(
+            f"Running {options['concurrency']} users for {options['duration']:g}s against {base_url}"
+        )
+        try:
+            with settings_override:
+                stats, elapsed = run_load(
+                    base_url,
+                    resume_ids,
+                    mix,
+                    concurrency=options['concurrency'],
+                    duration=options['duration'],
+                    seed=options['random_seed'],
+                )
+        finally:
+            if server is not None:
+                server.shutdown()
+                server.server_close()
+            if database and not options['keep']:
+                delete_seeded(using=database)
+
+        for line in format_report(stats, elapsed):
+            self.stdout.write(line)
@@ -0,0 +1,117 @@
+# Generated by Django 6.0 on 2026-10-19 06:50
+
+from django.db import migrations, models
+
+
+def backfill_section_counts(apps, schema_editor):
+    Resume = apps.get_model('builder', 'Resume')
+    for resume in Resume.objects.all().iterator():
+        Resume.objects.filter(pk=resume.pk).update(
+            education_count=len(resume.education or []),
+            experience_count=len(resume.experience or []),
+            projects_count=len(resume.projects or []),
+            skills_count=len(resume.skills or []),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('builder', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='resume',
+            options={'ordering': ['-updated_at'], 'verbose_name': 'Resume', 'verbose_name_plural': 'Resumes'},
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='education_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='experience_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='projects_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='skills_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_section_counts, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='resume',
+            name='education',
+            field=models.JSONField(blank=True, default=list, help_text='List of education entries with degree, institution, dates, details'),
+        ),
+        migrations.AlterField(
+            model_name='resume',
+            name='email',
+            field=models.EmailField(blank=True, help_text='Contact email address', max_length=254),
+        ),
+        migrations.AlterField(
+            model_name='resume',
+            name='experience',
+            field=models.JSONField(blank=True, default=list, help_text='List of experience entries with role, company, dates, bullets'),
+        ),
+        migrations.AlterField(
+            model_name='resume',
+            name='full_name',
+            field=models.CharField(blank=True, help_text='Your full name', max_length=120),
+        ),
+        migrations.AlterField(
+            model_name='resume',
+            name='github',
+            field=models.URLField(blank=True, help_text='GitHub profile URL'),
+        ),
+        migrations.AlterField(
+            model_name='resume',
+            name='linkedin',
+            field=models.URLField(blank=True, help_text='LinkedIn profile URL'),
+        ),
+        migrations.AlterField(
+            model_name='resume',
+            name='location',
+            field=models.CharField(blank=True, help_text='City, State or location', max_length=120),
+        ),
+        migrations.AlterField(
+            model_name='resume',
+            name='phone',
+            field=models.CharField(blank=True, help_text='Contact phone number', max_length=40),
+        ),
+        migrations.AlterField(
+            model_name='resume',
+            name='projects',
+            field=models.JSONField(blank=True, default=list, help_text='List of project entries with name, tech, bullets'),
+        ),
+        migrations.AlterField(
+            model_name='resume',
+            name='skills',
+            field=models.JSONField(blank=True, default=list, help_text='List of skill strings'),
+        ),
+        migrations.AlterField(
+            model_name='resume',
+            name='summary',
+            field=models.TextField(blank=True, help_text='Professional summary or objective'),
+        ),
+        migrations.AlterField(
+            model_name='resume',
+            name='title',
+            field=models.CharField(default='My Resume', help_text='Title for this resume', max_length=120),
+        ),
+        migrations.AddIndex(
+            model_name='resume',
+            index=models.Index(fields=['-updated_at'], name='builder_res_updated_09d6b5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resume',
+            index=models.Index(fields=['title'], name='builder_res_title_37a98e_idx'),
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 6.0 on 2026-10-19 07:05
+
+import builder.fields
+from django.db import migrations
+
+COMPRESSED_FIELDS = ('summary', 'education', 'experience', 'projects', 'skills')
+
+
+def compress_existing(apps, schema_editor):
+    # Existing rows were copied into the new column as plain text. Reading
+    # them through the new fields and writing them back compresses them.
+    Resume = apps.get_model('builder', 'Resume')
+    for resume in Resume.objects.only('pk', *COMPRESSED_FIELDS).iterator():
+        Resume.objects.filter(pk=resume.pk).update(
+            **{name: getattr(resume, name) for name in COMPRESSED_FIELDS}
+        )
+
+
+def decompress_existing(apps, schema_editor):
+    # Store plain text again so the old TextField/JSONField columns can read it.
+    connection = schema_editor.connection
+    qn = connection.ops.quote_name
+    columns = ', '.join(qn(name) for name in COMPRESSED_FIELDS)
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT {qn("id")}, {columns} FROM {qn("builder_resume")}')
+        rows = cursor.fetchall()
+        assignments = ', '.join(f'{qn(name)} = %s' for name in COMPRESSED_FIELDS)
+        for pk, *values in rows:
+            plain = [
+                None if value is None else builder.fields.decompress_text(value)
+                for value in values
+            ]
+            cursor.execute(
+                f'UPDATE {qn("builder_resume")} SET {assignments} WHERE {qn("id")} = %s',
+                [*plain, pk],
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('builder', '0002_section_counts'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='resume',
+            name='education',
+            field=builder.fields.CompressedJSONField(blank=True, default=list, help_text='List of education entries with degree, institution, dates, details'),
+        ),
+        migrations.AlterField(
+            model_name='resume',
+            name='experience',
+            field=builder.fields.CompressedJSONField(blank=True, default=list, help_text='List of experience entries with role, company, dates, bullets'),
+        ),
+        migrations.AlterField(
+            model_name='resume',
+            name='projects',
+            field=builder.fields.CompressedJSONField(blank=True, default=list, help_text='List of project entries with name, tech, bullets'),
+        ),
+        migrations.AlterField(
+            model_name='resume',
+            name='skills',
+            field=builder.fields.CompressedJSONField(blank=True, default=list, help_text='List of skill strings'),
+        ),
+        migrations.AlterField(
+            model_name='resume',
+            name='summary',
+            field=builder.fields.CompressedTextField(blank=True, help_text='Professional summary or objective'),
+        ),
+        migrations.RunPython(compress_existing, decompress_existing),
+    ]
@@ -2,6 +2,8 @@ from django.db import models
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 
+from .fields import CompressedJSONField, CompressedTextField
+
 
 class Resume(models.Model):
     """
@@ -19,30 +21,39 @@ class Resume(models.Model):
     location = models.CharField(max_length=120, blank=True, help_text="City, State or location")
     linkedin = models.URLField(blank=True, help_text="LinkedIn profile URL")
     github = models.URLField(blank=True, help_text="GitHub profile URL")
-    summary = models.TextField(blank=True, help_text="Professional summary or objective")
+    summary = CompressedTextField(blank=True, help_text="Professional summary or objective")
 
-    # Structured sections (stored as JSON)
-    education = models.JSONField(
+    # Structured sections (stored as compressed JSON)
+    education = CompressedJSONField(
         default=list, 
         blank=True,
         help_text="List of education entries with degree, institution, dates, details"
     )
-    experience = models.JSONField(
+    experience = CompressedJSONField(
         default=list, 
         blank=True,
         help_text="List of experience entries with role, company, dates, bullets"
     )
-    projects = models.JSONField(
+    projects = CompressedJSONField(
         default=list, 
         blank=True,
         help_text="List of project entries with name, tech, bullets"
     )
-    skills = models.JSONField(
+    skills = CompressedJSONField(
         default=list, 
         blank=True,
         help_text="List of skill strings"
     )
 
+    # Denormalized section sizes, kept in sync by save() so list pages can
+    # show and sort by them without loading the JSON columns.
+    education_count = models.PositiveIntegerField(default=0, editable=False)
+    experience_count = models.PositiveIntegerField(default=0, editable=False)
+    projects_count = models.PositiveIntegerField(default=0, editable=False)
+    skills_count = models.PositiveIntegerField(default=0, editable=False)
+
+    SECTION_FIELDS = ('education', 'experience', 'projects', 'skills')
+
     class Meta:
         ordering = ['-updated_at']
         indexes = [
@@ -68,6 +79,23 @@ class Resume(models.Model):
         if not self.phone:
             raise ValidationError({'phone': 'Phone is required.'})
 
+    def save(self, *args, **kwargs):
+        """Refresh the stored section counts before writing the row."""
+        counts = self.get_section_count()
+        for section in self.SECTION_FIELDS:
+            setattr(self, f'{section}_count', counts[section])
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            update_fields.update(
+                f'{section}_count' for section in self.SECTION_FIELDS
+                if section in update_fields
+            )
+            kwargs['update_fields'] = update_fields
+
+        super().save(*args, **kwargs)
+
     def get_section_count(self):
         """Return count of education, experience, and project entries."""
         return {
@@ -0,0 +1,128 @@
+"""
+Combined PDF "packets" of several resumes, e.g. a hiring shortlist.
+
+Each resume is rendered to its own PDF in a pool of worker processes, so
+render time scales with the number of cores. The pool is sized from the
+per-process share of the CPU budget (see ``RENDER_CPU_BUDGET``) and a packet
+takes one export admission slot per resume, up to all of them, so packets and
+single exports together stay within that budget. The results are merged in the
+requested order into one PDF with an outline (bookmark) entry per candidate.
+"""
+
+import copy
+import io
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+
+import django
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def worker_logging(config):
+    """
+    Return ``config`` without file handlers, for the pool's worker processes.
+
+    Workers would otherwise each open and rotate the web process's log file;
+    their records go to the remaining (console) handlers instead.
+    """
+    config = copy.deepcopy(config)
+    handlers = config.get("handlers", {})
+    file_handlers = {name for name, handler in handlers.items() if "filename" in handler}
+    for name in file_handlers:
+        del handlers[name]
+    for logger_config in [*config.get("loggers", {}).values(), config.get("root", {})]:
+        if "handlers" in logger_config:
+            logger_config["handlers"] = [h for h in logger_config["handlers"] if h not in file_handlers]
+    return config
+
+
+def _init_worker():
+    settings.LOGGING = worker_logging(settings.LOGGING)
+    django.setup()
+
+
+def _render_pdf(resume):
+    # Runs in a worker process; the PDF backend and fonts load once per worker.
+    from .exporters import get_exporter
+    return get_exporter("pdf").render(resume)
+
+
+def get_pool():
+    """Return the process pool shared by all packet requests in this process."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            workers = getattr(settings, "PACKET_WORKERS", None) or os.cpu_count() or 1
+            # Forking a threaded server process copies held locks and open
+            # database connections into the child; spawn starts clean.
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=get_context("spawn"),
+                initializer=_init_worker,
+            )
+        return _pool
+
+
+def _discard_pool(pool):
+    """Forget a broken pool so the next request starts a new one."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _render_all(resumes):
+    """
+    Yield each resume's PDF in order.
+
+    A worker that dies (e.g. killed for memory) breaks the whole pool, so
+    the pool is replaced and the remaining resumes are retried once.
+    """
+    done = 0
+    for attempt in range(2):
+        pool = get_pool()
+        try:
+            for pdf_bytes in pool.map(_render_pdf, resumes[done:]):
+                done += 1
+                yield pdf_bytes
+            return
+        except BrokenProcessPool:
+            _discard_pool(pool)
+            if attempt:
+                raise
+            logger.warning("Packet worker pool broke, restarting it")
+
+
+def outline_title(resume):
+    """Bookmark label for a resume in the packet."""
+    name = resume.full_name or "Unnamed"
+    return f"{name} — {resume.title}" if resume.title else name
+
+
+def render_packet(resumes, out):
+    """
+    Render resumes in parallel and write one merged PDF to ``out``.
+
+    Args:
+        resumes: Resume instances, in the order they should appear
+        out: Binary file object the merged PDF is written to
+    """
+    from pypdf import PdfReader, PdfWriter
+
+    writer = PdfWriter()
+    # map() yields in submission order, so merging starts with the first
+    # resume while later ones are still rendering.
+    for resume, pdf_bytes in zip(resumes, _render_all(list(resumes))):
+        writer.append(PdfReader(io.BytesIO(pdf_bytes)), outline_item=outline_title(resume))
+    writer.write(out)
+    logger.info("Rendered packet of %d resumes", len(resumes))
@@ -0,0 +1,107 @@
+"""
+Process-wide registry of TrueType fonts for PDF export.
+
+Fonts are parsed once per process, when the PDF backend is first imported
+(at start-up with ``EXPORT_PRELOAD``), and registered with ReportLab so every
+export shares the same parsed font objects. The fonts come from the
+``EXPORT_FONT_DIRS`` directories, followed by whichever of the
+``EXPORT_FALLBACK_FONTS`` system fonts exist, so non-Latin text still renders
+on hosts where nobody dropped fonts into ``fonts/``. ReportLab embeds only
+the glyphs a document actually uses, so a large Unicode font adds little to
+each PDF. Text that the built-in Helvetica can encode keeps using Helvetica;
+anything else is drawn with the first registered font that covers it.
+"""
+
+import logging
+import threading
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FONT = "Helvetica"
+
+
+class FontRegistry:
+    """Loaded TTF fonts in priority order, with the code points each covers."""
+
+    def __init__(self):
+        self._fonts = []
+        self._loaded_paths = set()
+        self._lock = threading.Lock()
+
+    @property
+    def font_names(self):
+        return [name for name, _ in self._fonts]
+
+    def load(self, paths):
+        """Parse and register each TTF file not already loaded."""
+        # Imported here so processes without any fonts never load ReportLab.
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+
+        with self._lock:
+            for path in paths:
+                path = Path(path)
+                if path in self._loaded_paths:
+                    continue
+                self._loaded_paths.add(path)
+                name = f"Speak2CV-{path.stem}"
+                try:
+                    font = TTFont(name, str(path))
+                except Exception as e:
+                    logger.error("Could not load font %s: %s", path, e)
+                    continue
+                pdfmetrics.registerFont(font)
+                coverage = frozenset(font.face.charToGlyph)
+                self._fonts.append((name, coverage))
+                logger.debug("Registered PDF font %s (%d glyphs)", name, len(coverage))
+
+    def font_for(self, text):
+        """Return the name of the font to draw ``text`` with."""
+        try:
+            (text or "").encode("cp1252")
+            return DEFAULT_FONT
+        except UnicodeEncodeError:
+            pass
+
+        needed = {ord(ch) for ch in text if not ch.isspace()}
+        best_name, best_missing = DEFAULT_FONT, None
+        for name, coverage in self._fonts:
+            missing = len(needed - coverage)
+            if not missing:
+                return name
+            if best_missing is None or missing < best_missing:
+                best_name, best_missing = name, missing
+        return best_name
+
+
+registry = FontRegistry()
+
+
+def font_paths(font_dirs):
+    """List the .ttf files in the given directories, sorted by file name."""
+    paths = []
+    for font_dir in font_dirs:
+        font_dir = Path(font_dir)
+        if font_dir.is_dir():
+            paths.extend(sorted(font_dir.glob("*.ttf"), key=lambda p: p.name.lower()))
+    return paths
+
+
+def export_font_paths():
+    """Font files to load for PDF export, in priority order."""
+    paths = font_paths(getattr(settings, "EXPORT_FONT_DIRS", []))
+    paths.extend(
+        Path(path) for path in getattr(settings, "EXPORT_FALLBACK_FONTS", [])
+        if Path(path).is_file()
+    )
+    return paths
+
+
+def load_export_fonts():
+    """Load the configured export fonts, if there are any."""
+    paths = export_font_paths()
+    if paths:
+        registry.load(paths)
@@ -0,0 +1,123 @@
+"""
+Read-through cache of Resume instances by id.
+
+Lookups try a bounded in-process LRU first, then the optional shared cache
+backend named by ``RESUME_CACHE_ALIAS``, and only then the database. Entries
+are stored pickled so every caller gets its own copy and can modify it
+freely. Only rows read from the primary database are cached, so a lagging
+replica never seeds the cache. ``post_save``/``post_delete`` (see
+builder.signals) drop the entry from this process and from the shared
+backend; other processes' local copies expire after ``RESUME_CACHE_TTL``
+seconds, which is why the edit page always reads the row itself.
+"""
+
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, router
+from django.shortcuts import get_object_or_404
+
+from .models import Resume
+
+
+class LocalResumeCache:
+    """Thread-safe LRU of pickled resumes with a per-entry time to live."""
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, resume_id):
+        with self._lock:
+            entry = self._entries.get(resume_id)
+            if entry is None:
+                return None
+            data, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[resume_id]
+                return None
+            self._entries.move_to_end(resume_id)
+            return data
+
+    def set(self, resume_id, data):
+        max_size = getattr(settings, "RESUME_CACHE_SIZE", 256)
+        if max_size <= 0:
+            return
+        ttl = getattr(settings, "RESUME_CACHE_TTL", 2)
+        with self._lock:
+            self._entries[resume_id] = (data, time.monotonic() + ttl)
+            self._entries.move_to_end(resume_id)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, resume_id):
+        with self._lock:
+            self._entries.pop(resume_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+local_cache = LocalResumeCache()
+
+
+def _shared_cache():
+    alias = getattr(settings, "RESUME_CACHE_ALIAS", None)
+    return caches[alias] if alias else None
+
+
+def _shared_key(resume_id):
+    return f"resume:{resume_id}"
+
+
+def get_resume_or_404(resume_id, fresh=False):
+    """
+    Return the Resume with this id, from cache if possible.
+
+    With ``fresh=True`` the cache is skipped and the row is read from the
+    primary database, e.g. right after buffered changes were written to it.
+    """
+    if fresh:
+        resume = get_object_or_404(Resume.objects.using(DEFAULT_DB_ALIAS), id=resume_id)
+        _store(resume)
+        return resume
+
+    data = local_cache.get(resume_id)
+    shared = _shared_cache()
+    if data is None and shared is not None:
+        data = shared.get(_shared_key(resume_id))
+        if data is not None:
+            local_cache.set(resume_id, data)
+    if data is not None:
+        return pickle.loads(data)
+
+    # Replica reads may lag behind the primary; caching one would keep
+    # serving the stale row to every request until the entry expires.
+    alias = router.db_for_read(Resume)
+    resume = get_object_or_404(Resume.objects.using(alias), id=resume_id)
+    if alias == DEFAULT_DB_ALIAS:
+        _store(resume)
+    return resume
+
+
+def _store(resume):
+    data = pickle.dumps(resume, protocol=pickle.HIGHEST_PROTOCOL)
+    local_cache.set(resume.pk, data)
+    shared = _shared_cache()
+    if shared is not None:
+        # A reader racing a save can store the row the save replaced, so
+        # shared entries must expire as quickly as local ones.
+        shared.set(_shared_key(resume.pk), data, timeout=getattr(settings, "RESUME_CACHE_TTL", 2))
+
+
+def invalidate(resume_id):
+    """Forget a resume in this process and in the shared backend."""
+    local_cache.delete(resume_id)
+    shared = _shared_cache()
+    if shared is not None:
+        shared.delete(_shared_key(resume_id))
@@ -0,0 +1,54 @@
+"""
+Database routing for the optional read replica.
+
+Views decorated with ``read_only_view`` read from the ``replica`` alias when
+one is configured. All other reads, and every write, use ``default`` so that
+edit pages always see their own saves.
+"""
+
+import contextvars
+from functools import wraps
+
+from django.conf import settings
+
+REPLICA_ALIAS = "replica"
+
+_use_replica = contextvars.ContextVar("use_replica", default=False)
+
+
+def replica_configured():
+    """Return True if a replica database alias is defined in settings."""
+    return REPLICA_ALIAS in settings.DATABASES
+
+
+def read_only_view(view_func):
+    """Route all reads made while handling this view to the replica."""
+    @wraps(view_func)
+    def wrapper(*args, **kwargs):
+        token = _use_replica.set(True)
+        try:
+            return view_func(*args, **kwargs)
+        finally:
+            _use_replica.reset(token)
+    return wrapper
+
+
+class ReplicaRouter:
+    """Send reads from read-only views to the replica, everything else to default."""
+
+    def db_for_read(self, model, **hints):
+        if _use_replica.get() and replica_configured():
+            return REPLICA_ALIAS
+        return "default"
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data, so relations across them are fine.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Keep the schema identical on both files so the replica can be
+        # migrated with ``migrate --database=replica``.
+        return True
@@ -0,0 +1,16 @@
+"""
+Signal handlers for the builder app.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Resume
+from .resume_cache import invalidate
+
+
+@receiver(post_save, sender=Resume)
+@receiver(post_delete, sender=Resume)
+def invalidate_resume_cache(sender, instance, **kwargs):
+    """Drop the cached copy of a resume whenever it changes."""
+    invalidate(instance.pk)
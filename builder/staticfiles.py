@@ -0,0 +1,154 @@
+"""
+Static asset pipeline: fingerprinted, minified and pre-compressed files.
+
+``collectstatic`` with ``CompressedManifestStaticFilesStorage`` writes each
+asset under a content-hashed name (``css/home.3f2a9c.css``) plus a manifest
+that ``{% static %}`` resolves through. CSS/JS files are minified (when
+``rcssmin``/``rjsmin`` are installed) as they are collected, before they are
+hashed, so each hash is computed over the bytes actually served. After
+hashing, gzip and brotli (when ``brotli`` is installed) variants are written
+next to the hashed files, which are themselves left untouched.
+
+``serve_static`` serves STATIC_ROOT for deployments without a front-end
+web server, picking the pre-compressed variant the client accepts and
+marking hashed files as cacheable forever.
+"""
+
+import gzip
+import mimetypes
+import posixpath
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+from django.http import FileResponse, Http404, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+COMPRESSIBLE_EXTENSIONS = {".css", ".js", ".svg", ".html", ".txt", ".json", ".map"}
+
+# Variants in order of preference: (Accept-Encoding token, file suffix).
+ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, max-age=0, must-revalidate"
+
+
+def _minify(path, data):
+    if path.suffix == ".css" and rcssmin is not None:
+        return rcssmin.cssmin(data.decode("utf-8")).encode("utf-8")
+    if path.suffix == ".js" and rjsmin is not None:
+        return rjsmin.jsmin(data.decode("utf-8")).encode("utf-8")
+    return data
+
+
+def _write_if_smaller(path, data, original_size):
+    if len(data) < original_size:
+        path.write_bytes(data)
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """Manifest storage that also minifies and pre-compresses collected files."""
+
+    # Rewrite `import ... from "./x.js"` in ES modules to hashed names.
+    support_js_module_import_aggregation = True
+
+    # Minify files as collectstatic copies them in; switched off while
+    # post-processing so hashed files are written exactly as hashed.
+    minify_on_save = True
+
+    def _save(self, name, content):
+        if self.minify_on_save and Path(name).suffix in (".css", ".js"):
+            data = content.read()
+            minified = _minify(Path(name), data)
+            if minified is not data:
+                content = ContentFile(minified)
+            else:
+                content.seek(0)
+        return super()._save(name, content)
+
+    def post_process(self, paths, dry_run=False, **options):
+        self.minify_on_save = False
+        try:
+            yield from super().post_process(paths, dry_run, **options)
+        finally:
+            self.minify_on_save = True
+        if dry_run:
+            return
+        for hashed_name in set(self.hashed_files.values()):
+            path = Path(self.path(hashed_name))
+            if path.suffix in COMPRESSIBLE_EXTENSIONS and path.is_file():
+                self._compress(path)
+
+    def _compress(self, path):
+        data = path.read_bytes()
+        # mtime=0 keeps the .gz output identical between builds.
+        _write_if_smaller(path.with_name(path.name + ".gz"), gzip.compress(data, 9, mtime=0), len(data))
+        if brotli is not None:
+            _write_if_smaller(path.with_name(path.name + ".br"), brotli.compress(data), len(data))
+
+
+def _accepted_encodings(request):
+    header = request.META.get("HTTP_ACCEPT_ENCODING", "")
+    accepted = set()
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(token.strip().lower())
+    return accepted
+
+
+@lru_cache(maxsize=1)
+def _hashed_names():
+    """Fingerprinted names from the manifest, read once per process."""
+    from django.contrib.staticfiles.storage import staticfiles_storage
+
+    return frozenset(getattr(staticfiles_storage, "hashed_files", {}).values())
+
+
+def serve_static(request, path):
+    """Serve a file from STATIC_ROOT, preferring a pre-compressed variant."""
+    path = posixpath.normpath(path).lstrip("/")
+    fullpath = Path(safe_join(settings.STATIC_ROOT, path))
+    if not fullpath.is_file():
+        raise Http404("Static file not found")
+
+    served, encoding = fullpath, None
+    accepted = _accepted_encodings(request)
+    for token, suffix in ENCODINGS:
+        candidate = fullpath.with_name(fullpath.name + suffix)
+        if token in accepted and candidate.is_file():
+            served, encoding = candidate, token
+            break
+
+    statobj = served.stat()
+    if not was_modified_since(request.META.get("HTTP_IF_MODIFIED_SINCE"), statobj.st_mtime):
+        response = HttpResponseNotModified()
+    else:
+        content_type, _ = mimetypes.guess_type(str(fullpath))
+        response = FileResponse(served.open("rb"), content_type=content_type or "application/octet-stream")
+        response["Last-Modified"] = http_date(statobj.st_mtime)
+        if encoding:
+            response["Content-Encoding"] = encoding
+    response["Vary"] = "Accept-Encoding"
+    response["Cache-Control"] = IMMUTABLE_CACHE_CONTROL if path in _hashed_names() else REVALIDATE_CACHE_CONTROL
+    return response
@@ -1,3 +1,504 @@
-from django.test import TestCase
+import io
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, connection
+from django.http import HttpResponse
+from django.db.migrations.executor import MigrationExecutor
+from django.http import Http404
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+
+from config.log_handlers import QueuedRotatingFileHandler
+
+from . import packets
+from .autosave import AutosaveBuffer, buffer as autosave_buffer
+from .models import Resume
+from .resume_cache import get_resume_or_404, local_cache
+from .routers import REPLICA_ALIAS, ReplicaRouter, read_only_view
+from .throttling import AdmissionController, export_admission
+from .validation import validate_section
+
+
+class ReplicaRouterTests(SimpleTestCase):
+    def setUp(self):
+        self.router = ReplicaRouter()
+
+    def test_reads_use_default_without_replica(self):
+        with mock.patch("builder.routers.replica_configured", return_value=False):
+            read = read_only_view(lambda: self.router.db_for_read(Resume))
+            self.assertEqual(read(), "default")
+
+    def test_read_only_views_read_from_replica(self):
+        with mock.patch("builder.routers.replica_configured", return_value=True):
+            read = read_only_view(lambda: self.router.db_for_read(Resume))
+            self.assertEqual(read(), REPLICA_ALIAS)
+            # The flag is reset once the view returns.
+            self.assertEqual(self.router.db_for_read(Resume), "default")
+
+    def test_writes_always_use_default(self):
+        with mock.patch("builder.routers.replica_configured", return_value=True):
+            write = read_only_view(lambda: self.router.db_for_write(Resume))
+            self.assertEqual(write(), "default")
+
+
+# Creates a resume, then counts resumes from a read-only view and a normal one.
+TWO_DATABASE_SCRIPT = """
+import json
+from builder.models import Resume
+from builder.routers import read_only_view
+Resume.objects.create(title="Routed", full_name="A", email="a@example.com", phone="1")
+print(json.dumps({
+    "read_only": read_only_view(Resume.objects.count)(),
+    "default": Resume.objects.count(),
+}))
+"""
+
+
+class TwoDatabaseRoutingTests(SimpleTestCase):
+    """Routing against a primary and a replica kept in separate SQLite files."""
+
+    def manage(self, env, *args):
+        return subprocess.run(
+            [sys.executable, str(settings.BASE_DIR / "manage.py"), *args],
+            env=env, capture_output=True, text=True, check=True,
+        ).stdout
+
+    def test_read_only_views_read_the_replica_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {
+                **os.environ,
+                "DATABASE_NAME": os.path.join(tmp, "primary.sqlite3"),
+                "DATABASE_REPLICA_NAME": os.path.join(tmp, "replica.sqlite3"),
+            }
+            self.manage(env, "migrate", "-v0")
+            self.manage(env, "migrate", "-v0", "--database", REPLICA_ALIAS)
+            output = self.manage(env, "shell", "-c", TWO_DATABASE_SCRIPT)
+
+        counts = json.loads(output.strip().splitlines()[-1])
+        # Nothing replicates between the files, so only the primary has the row.
+        self.assertEqual(counts, {"read_only": 0, "default": 1})
+
+
+class MigrationTests(TransactionTestCase):
+    """Data migrations run against rows created with the older schema."""
+
+    latest = "0003_compress_resume_content"
+
+    def migrate(self, name):
+        target = ("builder", name)
+        executor = MigrationExecutor(connection)
+        executor.migrate([target])
+        executor.loader.build_graph()
+        return executor.loader.project_state([target]).apps
+
+    def tearDown(self):
+        self.migrate(self.latest)
+
+    def test_section_counts_are_backfilled(self):
+        apps = self.migrate("0001_initial")
+        OldResume = apps.get_model("builder", "Resume")
+        resume = OldResume.objects.create(
+            title="Old", full_name="A", email="a@example.com", phone="1",
+            education=[{"degree": "BSc"}],
+            experience=[{"role": "Dev"}, {"role": "Lead"}],
+            skills=["Python", "SQL", "Docker"],
+        )
+
+        apps = self.migrate("0002_section_counts")
+        resume = apps.get_model("builder", "Resume").objects.get(pk=resume.pk)
+        self.assertEqual(
+            (resume.education_count, resume.experience_count,
+             resume.projects_count, resume.skills_count),
+            (1, 2, 0, 3),
+        )
+
+    def raw_column(self, pk, column):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT typeof({column}), {column} FROM builder_resume WHERE id = %s", [pk]
+            )
+            return cursor.fetchone()
+
+    def test_content_is_compressed_and_restored(self):
+        summary = "Built and operated reliable Django services. " * 20
+        apps = self.migrate("0002_section_counts")
+        resume = apps.get_model("builder", "Resume").objects.create(
+            title="Old", full_name="A", email="a@example.com", phone="1",
+            summary=summary, skills=["Python"],
+        )
+
+        self.migrate("0003_compress_resume_content")
+        kind, value = self.raw_column(resume.pk, "summary")
+        self.assertEqual(kind, "blob")
+        self.assertLess(len(value), len(summary))
+        resume = Resume.objects.get(pk=resume.pk)
+        self.assertEqual(resume.summary, summary)
+        self.assertEqual(resume.skills, ["Python"])
+
+        self.migrate("0002_section_counts")
+        self.assertEqual(self.raw_column(resume.pk, "summary"), ("text", summary))
+
+
+class AdmissionControllerTests(SimpleTestCase):
+    def test_refuses_when_queue_is_full(self):
+        controller = AdmissionController(max_concurrency=1, max_queue=0, queue_timeout=1)
+        self.assertTrue(controller.acquire())
+        self.assertFalse(controller.acquire())
+        controller.release()
+        self.assertTrue(controller.acquire())
+
+    def test_queued_request_times_out(self):
+        controller = AdmissionController(max_concurrency=1, max_queue=1, queue_timeout=0.05)
+        self.assertTrue(controller.acquire())
+        self.assertFalse(controller.acquire())
+
+    def test_queued_request_is_admitted_on_release(self):
+        controller = AdmissionController(max_concurrency=1, max_queue=1, queue_timeout=5)
+        controller.acquire()
+        results = []
+        waiter = threading.Thread(target=lambda: results.append(controller.acquire()))
+        waiter.start()
+        controller.release()
+        waiter.join()
+        self.assertEqual(results, [True])
+
+    def test_weighted_requests_share_capacity(self):
+        controller = AdmissionController(max_concurrency=4, max_queue=1, queue_timeout=0.05)
+        self.assertTrue(controller.acquire(3))
+        self.assertFalse(controller.acquire(2))
+        self.assertTrue(controller.acquire(1))
+        controller.release(3)
+        controller.release(1)
+        # Weights above the capacity are capped rather than never admitted.
+        self.assertTrue(controller.acquire(10))
+        self.assertFalse(controller.acquire())
+
+
+@override_settings(EXPORT_RATE_LIMIT=1, EXPORT_RATE_WINDOW=3600)
+class ExportRateLimitTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_second_export_in_window_is_rejected(self):
+        view = export_admission(lambda request: HttpResponse("ok"))
+        request = RequestFactory().get("/")
+        self.assertEqual(view(request).status_code, 200)
+        response = view(request)
+        self.assertEqual(response.status_code, 429)
+        self.assertGreaterEqual(int(response["Retry-After"]), 1)
+
+
+class ValidateSectionTests(SimpleTestCase):
+    def assertRejected(self, section, raw, message):
+        with self.assertRaises(ValidationError) as cm:
+            validate_section(section, raw)
+        self.assertEqual(cm.exception.messages, [message])
+
+    def test_valid_entries_are_cleaned(self):
+        raw = json.dumps([{"role": "Dev", "company": "Acme", "bullets": ["Shipped"], "extra": "x"}])
+        self.assertEqual(
+            validate_section("experience", raw),
+            [{"role": "Dev", "company": "Acme", "bullets": ["Shipped"]}],
+        )
+        self.assertEqual(validate_section("skills", '["Python", "SQL"]'), ["Python", "SQL"])
+        self.assertEqual(validate_section("projects", ""), [])
+
+    def test_malformed_payloads_are_rejected(self):
+        self.assertRejected("education", "{not json", "Education could not be read. Please try again.")
+        self.assertRejected("education", '{"degree": "BSc"}', "Education must be a list.")
+        self.assertRejected("experience", '["Dev"]', "Each Experience entry must be an object.")
+        self.assertRejected("skills", "[1]", "Skills entry must be text.")
+
+    def test_limits_are_enforced(self):
+        self.assertRejected(
+            "experience", json.dumps([{"role": "x" * 201}]),
+            "Experience role must be at most 200 characters.",
+        )
+        self.assertRejected(
+            "projects", json.dumps([{"bullets": ["x"] * 21}]),
+            "Projects can have at most 20 bullets.",
+        )
+        self.assertRejected("skills", json.dumps(["x"] * 51), "Skills can have at most 50 entries.")
+
+    def test_size_limit_counts_utf8_bytes(self):
+        # Fewer characters than RESUME_MAX_SECTION_BYTES, but more bytes.
+        raw = json.dumps(["é" * 40000], ensure_ascii=False)
+        self.assertLess(len(raw), settings.RESUME_MAX_SECTION_BYTES)
+        self.assertRejected("skills", raw, "Skills is too large.")
+
+
+# Keep the background flusher idle so tests decide when buffers are written.
+@override_settings(AUTOSAVE_DEBOUNCE=3600, AUTOSAVE_MAX_DELAY=3600)
+class AutosaveBufferTests(TransactionTestCase):
+    def setUp(self):
+        self.buffer = AutosaveBuffer()
+        self.resume = Resume.objects.create(
+            title="Draft", full_name="A", email="a@example.com", phone="1",
+        )
+
+    def reload(self):
+        return Resume.objects.get(pk=self.resume.pk)
+
+    def test_changes_are_merged_into_one_write(self):
+        self.buffer.submit(self.resume.pk, {"summary": "First"})
+        self.buffer.submit(self.resume.pk, {"summary": "Second", "location": "Pune"})
+        with mock.patch.object(Resume, "save", autospec=True, side_effect=Resume.save) as save:
+            self.assertTrue(self.buffer.flush(self.resume.pk))
+        self.assertEqual(save.call_count, 1)
+        resume = self.reload()
+        self.assertEqual((resume.summary, resume.location), ("Second", "Pune"))
+        # Nothing left to write.
+        self.assertFalse(self.buffer.flush(self.resume.pk))
+
+    def test_newer_save_wins_over_buffered_changes(self):
+        self.buffer.submit(self.resume.pk, {"summary": "Autosaved"})
+        resume = self.reload()
+        resume.summary = "Saved"
+        resume.save()
+        with self.assertLogs("builder.autosave", "INFO") as logs:
+            self.assertFalse(self.buffer.flush(self.resume.pk))
+        self.assertIn("Dropped stale autosave", logs.output[0])
+        self.assertEqual(self.reload().summary, "Saved")
+
+    def test_own_writes_do_not_make_later_changes_stale(self):
+        self.buffer.submit(self.resume.pk, {"summary": "One"})
+        self.assertTrue(self.buffer.flush(self.resume.pk))
+        self.buffer.submit(self.resume.pk, {"summary": "Two"})
+        self.assertTrue(self.buffer.flush(self.resume.pk))
+        self.assertEqual(self.reload().summary, "Two")
+
+    def test_failed_write_is_retried(self):
+        self.buffer.submit(self.resume.pk, {"summary": "Retry me"})
+        with mock.patch.object(Resume, "save", side_effect=DatabaseError("database is locked")), \
+                self.assertLogs("builder.autosave", "ERROR"):
+            self.assertFalse(self.buffer.flush(self.resume.pk))
+        self.assertTrue(self.buffer.has_pending(self.resume.pk))
+        self.assertTrue(self.buffer.flush(self.resume.pk))
+        self.assertEqual(self.reload().summary, "Retry me")
+
+    @override_settings(AUTOSAVE_MAX_RETRIES=1)
+    def test_failed_write_is_dropped_after_max_retries(self):
+        self.buffer.submit(self.resume.pk, {"summary": "Lost"})
+        with mock.patch.object(Resume, "save", side_effect=DatabaseError("disk I/O error")), \
+                self.assertLogs("builder.autosave", "ERROR") as logs:
+            self.buffer.flush(self.resume.pk)
+            self.buffer.flush(self.resume.pk)
+        self.assertIn("Giving up", logs.output[-1])
+        self.assertFalse(self.buffer.has_pending(self.resume.pk))
+
+    def test_per_resume_state_is_pruned(self):
+        self.buffer.submit(self.resume.pk, {"summary": "One"})
+        self.assertTrue(self.buffer.flush(self.resume.pk))
+        self.buffer.submit(self.resume.pk, {"summary": "Two"})
+        self.buffer.discard(self.resume.pk)
+        self.assertEqual(self.buffer._locks, {})
+        self.assertEqual(self.buffer._written_at, {})
+
+    def test_discard_drops_changes(self):
+        self.buffer.submit(self.resume.pk, {"summary": "Discarded"})
+        self.buffer.discard(self.resume.pk)
+        self.assertFalse(self.buffer.flush(self.resume.pk))
+        self.assertEqual(self.reload().summary, "")
+
+    def test_dead_flusher_thread_is_restarted(self):
+        self.buffer.submit(self.resume.pk, {"summary": "x"})
+        self.buffer._thread = threading.Thread(target=lambda: None)
+        self.buffer._thread.start()
+        self.buffer._thread.join()
+        self.buffer.submit(self.resume.pk, {"summary": "y"})
+        self.assertTrue(self.buffer._thread.is_alive())
+        self.buffer.discard(self.resume.pk)
+
+    def test_autosave_view_skips_blank_required_and_over_long_fields(self):
+        response = self.client.post(
+            f"/builder/r/{self.resume.pk}/autosave/",
+            {"title": "", "email": "", "full_name": "B" * 121,
+             "linkedin": "linkedin.com/in/x", "summary": "Kept"},
+        )
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()["skipped"], ["title", "full_name", "email"])
+        self.assertTrue(autosave_buffer.flush(self.resume.pk))
+        resume = self.reload()
+        self.assertEqual(
+            (resume.title, resume.email, resume.linkedin, resume.summary),
+            ("Draft", "a@example.com", "linkedin.com/in/x", "Kept"),
+        )
+
+    def test_explicit_save_accepts_values_without_a_scheme(self):
+        response = self.client.post(f"/builder/r/{self.resume.pk}/edit/", {
+            "title": "Draft", "full_name": "A", "email": "a@b.c", "phone": "1",
+            "linkedin": "linkedin.com/in/x", "github": "github.com/x",
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self.reload().linkedin, "linkedin.com/in/x")
+
+
+class QueuedRotatingFileHandlerTests(SimpleTestCase):
+    def test_records_keep_the_values_they_were_logged_with(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "test.log")
+            handler = QueuedRotatingFileHandler(path)
+            handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+            logger = logging.getLogger("builder.tests.queued")
+            logger.addHandler(handler)
+            try:
+                data = {"k": 1}
+                logger.warning("value %s", data)
+                data["k"] = 2
+                try:
+                    raise ValueError("boom")
+                except ValueError:
+                    logger.exception("failed")
+            finally:
+                logger.removeHandler(handler)
+                handler.close()
+            with open(path, encoding="utf-8") as f:
+                output = f.read()
+        self.assertIn("WARNING value {'k': 1}", output)
+        self.assertIn("ERROR failed", output)
+        self.assertIn("ValueError: boom", output)
+
+
+class LazyExportBackendTests(SimpleTestCase):
+    def test_setup_does_not_import_export_libraries(self):
+        script = (
+            "import sys, django; django.setup(); "
+            "print(sorted({m.split('.')[0] for m in sys.modules} & {'reportlab', 'docx'}))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            env={**os.environ, "EXPORT_PRELOAD": "False"},
+            capture_output=True, text=True, check=True,
+        ).stdout
+        self.assertEqual(output.strip(), "[]")
+
+
+@override_settings(RESUME_CACHE_SIZE=16, RESUME_CACHE_TTL=60, RESUME_CACHE_ALIAS="default")
+class ResumeCacheTests(TestCase):
+    def setUp(self):
+        local_cache.clear()
+        cache.clear()
+        self.resume = Resume.objects.create(
+            title="Cached", full_name="A", email="a@example.com", phone="1",
+        )
+        # Creating the row fired post_save; start from an empty cache.
+        local_cache.clear()
+        cache.clear()
+
+    def test_second_lookup_is_served_from_cache(self):
+        with self.assertNumQueries(1):
+            get_resume_or_404(self.resume.pk)
+        with self.assertNumQueries(0):
+            resume = get_resume_or_404(self.resume.pk)
+        self.assertEqual(resume.title, "Cached")
+
+    def test_shared_entry_refills_the_local_cache(self):
+        get_resume_or_404(self.resume.pk)
+        local_cache.clear()
+        with self.assertNumQueries(0):
+            get_resume_or_404(self.resume.pk)
+
+    def test_shared_entries_expire_with_the_cache_ttl(self):
+        with mock.patch.object(cache, "set") as cache_set:
+            get_resume_or_404(self.resume.pk)
+        self.assertEqual(cache_set.call_args.kwargs["timeout"], 60)
+
+    def test_save_invalidates(self):
+        get_resume_or_404(self.resume.pk)
+        self.resume.title = "Renamed"
+        self.resume.save()
+        with self.assertNumQueries(1):
+            self.assertEqual(get_resume_or_404(self.resume.pk).title, "Renamed")
+
+    def test_delete_invalidates(self):
+        get_resume_or_404(self.resume.pk)
+        pk = self.resume.pk
+        self.resume.delete()
+        with self.assertRaises(Http404):
+            get_resume_or_404(pk)
+
+    def test_replica_reads_are_not_cached(self):
+        copy = Resume.objects.get(pk=self.resume.pk)
+        with mock.patch("builder.resume_cache.router.db_for_read", return_value=REPLICA_ALIAS), \
+                mock.patch("builder.resume_cache.get_object_or_404", return_value=copy) as lookup:
+            self.assertEqual(get_resume_or_404(self.resume.pk), copy)
+        self.assertEqual(lookup.call_args.args[0].db, REPLICA_ALIAS)
+        self.assertIsNone(local_cache.get(self.resume.pk))
+        self.assertIsNone(cache.get(f"resume:{self.resume.pk}"))
+
+    def test_fresh_lookup_reads_the_primary(self):
+        get_resume_or_404(self.resume.pk)
+        with self.assertNumQueries(1):
+            get_resume_or_404(self.resume.pk, fresh=True)
+
+
+class PacketTests(SimpleTestCase):
+    def make_resumes(self):
+        return [
+            Resume(title="Backend", full_name="Zoe", email="z@example.com", phone="1"),
+            Resume(title="", full_name="Adam", email="a@example.com", phone="2"),
+            Resume(title="Data", full_name="", email="m@example.com", phone="3"),
+        ]
+
+    def test_packet_keeps_order_and_outline_titles(self):
+        from pypdf import PdfReader
+
+        out = io.BytesIO()
+        packets.render_packet(self.make_resumes(), out)
+        reader = PdfReader(io.BytesIO(out.getvalue()))
+        self.assertEqual(
+            [item.title for item in reader.outline],
+            ["Zoe — Backend", "Adam", "Unnamed — Data"],
+        )
+        pages = [reader.get_destination_page_number(item) for item in reader.outline]
+        self.assertEqual(pages, sorted(set(pages)))
+
+    def test_broken_pool_is_replaced(self):
+        broken = mock.Mock()
+        broken.map.side_effect = BrokenProcessPool("worker died")
+        with mock.patch.object(packets, "_pool", broken), \
+                mock.patch.object(packets, "_render_pdf", lambda resume: resume.full_name), \
+                mock.patch.object(packets, "ProcessPoolExecutor") as executor, \
+                self.assertLogs("builder.packets", "WARNING"):
+            executor.return_value.map.side_effect = lambda func, items: map(func, items)
+            names = list(packets._render_all(self.make_resumes()))
+        self.assertEqual(names, ["Zoe", "Adam", ""])
+        broken.shutdown.assert_called_once()
+
+    def test_workers_do_not_log_to_files(self):
+        config = packets.worker_logging(settings.LOGGING)
+        self.assertNotIn("file", config["handlers"])
+        for logger_config in config["loggers"].values():
+            self.assertNotIn("file", logger_config.get("handlers", []))
+        # The web process's own config is left alone.
+        self.assertIn("file", settings.LOGGING["handlers"])
+
+
+@override_settings(PACKET_MAX_RESUMES=2, EXPORT_RATE_LIMIT=0)
+class PacketViewAdmissionTests(TestCase):
+    def setUp(self):
+        # No capacity left and no queue: anything that asks for a slot gets 503.
+        self.controller = AdmissionController(max_concurrency=1, max_queue=0, queue_timeout=0)
+        self.controller.acquire()
+        patcher = mock.patch("builder.throttling.get_export_controller", return_value=self.controller)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_invalid_packets_are_rejected_before_admission(self):
+        self.assertEqual(self.client.get("/builder/packet/pdf/?ids=1,2,3").status_code, 400)
+        self.assertEqual(self.client.get("/builder/packet/pdf/?ids=999").status_code, 404)
+
+    def test_valid_packet_waits_for_admission(self):
+        resume = Resume.objects.create(title="T", full_name="A", email="a@example.com", phone="1")
+        response = self.client.get(f"/builder/packet/pdf/?ids={resume.pk}")
+        self.assertEqual(response.status_code, 503)
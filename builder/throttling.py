@@ -0,0 +1,158 @@
+"""
+Admission control for the CPU-heavy export views.
+
+Each worker process lets at most ``EXPORT_MAX_CONCURRENCY`` exports render
+at once. Further requests wait in a bounded queue for up to
+``EXPORT_QUEUE_TIMEOUT`` seconds; when the queue is full or the wait times
+out the request is turned away with ``503`` and ``Retry-After``. Bulk
+exports can take several slots at once. Each client
+is also limited to ``EXPORT_RATE_LIMIT`` exports per ``EXPORT_RATE_WINDOW``
+seconds (``429``), counted in the default cache so the limit is shared
+between processes when a shared cache backend is configured.
+"""
+
+import logging
+import math
+import os
+import threading
+import time
+from functools import lru_cache, wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionController:
+    """Concurrency cap with a bounded, time-limited wait queue."""
+
+    def __init__(self, max_concurrency, max_queue, queue_timeout):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._cond = threading.Condition()
+        self._active = 0
+        self._waiting = 0
+
+    def _weight(self, weight):
+        return max(1, min(weight, self.max_concurrency))
+
+    def acquire(self, weight=1):
+        """
+        Take ``weight`` slots, waiting if needed.
+
+        Weights above ``max_concurrency`` are capped, so a large request waits
+        for the whole capacity rather than forever.
+
+        Returns:
+            False if admission is refused, otherwise True
+        """
+        weight = self._weight(weight)
+        with self._cond:
+            # Don't let new arrivals jump ahead of requests already queued.
+            if self._active + weight <= self.max_concurrency and not self._waiting:
+                self._active += weight
+                return True
+            if self._waiting >= self.max_queue:
+                return False
+            self._waiting += 1
+            try:
+                admitted = self._cond.wait_for(
+                    lambda: self._active + weight <= self.max_concurrency,
+                    timeout=self.queue_timeout,
+                )
+                if admitted:
+                    self._active += weight
+                return admitted
+            finally:
+                self._waiting -= 1
+
+    def release(self, weight=1):
+        """Return slots taken by ``acquire()`` with the same weight."""
+        with self._cond:
+            self._active -= self._weight(weight)
+            # Waiters need different numbers of slots, so wake them all.
+            self._cond.notify_all()
+
+
+@lru_cache(maxsize=None)
+def get_export_controller():
+    """Return the process-wide controller built from settings."""
+    return AdmissionController(
+        max_concurrency=getattr(settings, "EXPORT_MAX_CONCURRENCY", os.cpu_count() or 2),
+        max_queue=getattr(settings, "EXPORT_MAX_QUEUE", 8),
+        queue_timeout=getattr(settings, "EXPORT_QUEUE_TIMEOUT", 5),
+    )
+
+
+def _client_key(request):
+    return request.META.get("REMOTE_ADDR") or "unknown"
+
+
+def _check_rate_limit(request):
+    """
+    Count this request against the client's export budget.
+
+    Returns:
+        Seconds until the current window resets if the limit is exceeded,
+        otherwise None.
+    """
+    limit = getattr(settings, "EXPORT_RATE_LIMIT", 10)
+    if not limit:
+        return None
+    window = getattr(settings, "EXPORT_RATE_WINDOW", 60)
+    now = time.time()
+    bucket = int(now // window)
+    key = f"export-rate:{_client_key(request)}:{bucket}"
+    cache.add(key, 0, timeout=window)
+    try:
+        count = cache.incr(key)
+    except ValueError:
+        # The key expired between add() and incr().
+        cache.set(key, 1, timeout=window)
+        count = 1
+    if count > limit:
+        return math.ceil((bucket + 1) * window - now)
+    return None
+
+
+def _retry_response(message, status, retry_after):
+    response = HttpResponse(message, status=status, content_type="text/plain")
+    response["Retry-After"] = str(max(int(retry_after), 1))
+    return response
+
+
+def export_admission(view_func=None, *, weight=None):
+    """
+    Apply the per-client rate limit and concurrency cap to an export view.
+
+    Each request takes one slot, or ``weight(request, *args, **kwargs)``
+    slots when given, so that e.g. a packet of many resumes counts as many
+    exports.
+    """
+    if view_func is None:
+        return lambda func: export_admission(func, weight=weight)
+
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        retry_after = _check_rate_limit(request)
+        if retry_after is not None:
+            logger.warning("Export rate limit exceeded for %s", _client_key(request))
+            return _retry_response("Too many export requests", 429, retry_after)
+
+        controller = get_export_controller()
+        slots = weight(request, *args, **kwargs) if weight else 1
+        if not controller.acquire(slots):
+            logger.warning("Export capacity exhausted, rejecting request")
+            return _retry_response(
+                "Export service is busy, please try again shortly",
+                503,
+                math.ceil(controller.queue_timeout) or 1,
+            )
+        try:
+            return view_func(request, *args, **kwargs)
+        finally:
+            controller.release(slots)
+    return wrapper
@@ -0,0 +1,134 @@
+"""
+Validation of the structured resume sections posted by the edit page.
+
+Each section has a small schema that is compiled once into a checking
+function. Posted JSON is size-checked before it is parsed, and every entry is
+checked for shape, entry/bullet counts and string lengths, so whatever
+reaches the database has bounded size and the types the exporters expect.
+Unknown keys are dropped.
+"""
+
+import json
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+
+# Field kinds used in the schemas below.
+LINE = "line"        # short single-line string
+TEXT = "text"        # longer free text
+BULLETS = "bullets"  # list of TEXT strings
+
+SECTION_SCHEMAS = {
+    "education": {"degree": LINE, "institution": LINE, "dates": LINE, "details": TEXT},
+    "experience": {"role": LINE, "company": LINE, "dates": LINE, "bullets": BULLETS},
+    "projects": {"name": LINE, "tech": LINE, "bullets": BULLETS},
+    # Skills are a flat list of strings rather than objects.
+    "skills": LINE,
+}
+
+SECTION_LABELS = {
+    "education": "Education",
+    "experience": "Experience",
+    "projects": "Projects",
+    "skills": "Skills",
+}
+
+
+def _limits():
+    return {
+        "entries": getattr(settings, "RESUME_MAX_ENTRIES", 50),
+        "bullets": getattr(settings, "RESUME_MAX_BULLETS", 20),
+        LINE: getattr(settings, "RESUME_MAX_LINE_CHARS", 200),
+        TEXT: getattr(settings, "RESUME_MAX_TEXT_CHARS", 2000),
+    }
+
+
+def _compile_string(kind, limits, label):
+    max_chars = limits[kind]
+
+    def check(value):
+        if value is None:
+            return ""
+        if not isinstance(value, str):
+            raise ValidationError(f"{label} must be text.")
+        if len(value) > max_chars:
+            raise ValidationError(f"{label} must be at most {max_chars} characters.")
+        return value
+    return check
+
+
+def _compile_bullets(limits, label):
+    max_bullets = limits["bullets"]
+    check_bullet = _compile_string(TEXT, limits, f"{label} bullet")
+
+    def check(value):
+        if value is None:
+            return []
+        if not isinstance(value, list):
+            raise ValidationError(f"{label} bullets must be a list.")
+        if len(value) > max_bullets:
+            raise ValidationError(f"{label} can have at most {max_bullets} bullets.")
+        return [check_bullet(bullet) for bullet in value]
+    return check
+
+
+def _compile_entry(schema, limits, label):
+    if not isinstance(schema, dict):
+        return _compile_string(schema, limits, f"{label} entry")
+
+    checks = {
+        key: _compile_bullets(limits, label) if kind == BULLETS
+        else _compile_string(kind, limits, f"{label} {key}")
+        for key, kind in schema.items()
+    }
+
+    def check(entry):
+        if not isinstance(entry, dict):
+            raise ValidationError(f"Each {label} entry must be an object.")
+        return {key: checks[key](entry[key]) for key in checks if key in entry}
+    return check
+
+
+@lru_cache(maxsize=None)
+def get_section_validator(section):
+    """Return the compiled validator for a section."""
+    limits = _limits()
+    label = SECTION_LABELS[section]
+    check_entry = _compile_entry(SECTION_SCHEMAS[section], limits, label)
+    max_entries = limits["entries"]
+    max_bytes = getattr(settings, "RESUME_MAX_SECTION_BYTES", 64 * 1024)
+
+    def validate(raw):
+        raw = raw or "[]"
+        # Reject oversized payloads before spending time parsing them. A
+        # character is at least one UTF-8 byte, so only encode when needed.
+        if len(raw) > max_bytes or len(raw.encode("utf-8")) > max_bytes:
+            raise ValidationError(f"{label} is too large.")
+        try:
+            entries = json.loads(raw)
+        except json.JSONDecodeError:
+            raise ValidationError(f"{label} could not be read. Please try again.")
+        if not isinstance(entries, list):
+            raise ValidationError(f"{label} must be a list.")
+        if len(entries) > max_entries:
+            raise ValidationError(f"{label} can have at most {max_entries} entries.")
+        return [check_entry(entry) for entry in entries]
+    return validate
+
+
+def validate_section(section, raw):
+    """
+    Parse and validate the posted JSON for a section.
+
+    Args:
+        section: Section name ("education", "experience", "projects" or "skills")
+        raw: Raw JSON string from the request
+
+    Returns:
+        The cleaned list of entries
+
+    Raises:
+        ValidationError: If the payload is too large or does not match the schema
+    """
+    return get_section_validator(section)(raw)
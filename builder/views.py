@@ -4,23 +4,31 @@ Resume builder views.
 Handles CRUD operations for resumes and export functionality (PDF, DOCX).
 """
 
-import io
 import json
 import logging
+import tempfile
 
-from django.http import HttpResponse, JsonResponse
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.http import FileResponse, Http404, HttpResponse, JsonResponse
 from django.shortcuts import render, redirect, get_object_or_404
 
-from reportlab.lib.pagesizes import LETTER
-from reportlab.pdfgen import canvas
-
-from docx import Document
-
+from .autosave import buffer as autosave_buffer
+from .exporters import get_backends, get_exporter
 from .models import Resume
+from .packets import render_packet
+from .resume_cache import get_resume_or_404
+from .routers import read_only_view
+from .throttling import export_admission
+from .validation import SECTION_SCHEMAS, validate_section
 
 logger = logging.getLogger(__name__)
 
+# Longest excerpt of a request payload written to the log.
+LOG_EXCERPT_CHARS = 200
+
 
+@read_only_view
 def home(request):
     """Display list of recent resumes."""
     resumes = Resume.objects.all()[:20]
@@ -30,12 +38,13 @@ def home(request):
 def delete_resume(request, resume_id: int):
     """Delete a resume. Returns JSON for AJAX or redirects to home."""
     resume = get_object_or_404(Resume, id=resume_id)
+    autosave_buffer.discard(resume_id)
     try:
         resume.delete()
         if request.method == "POST":
             return JsonResponse({"status": "success"})
     except Exception as e:
-        logger.error(f"Error deleting resume {resume_id}: {e}")
+        logger.error("Error deleting resume %s: %s", resume_id, e)
         if request.method == "POST":
             return JsonResponse({"status": "error"}, status=500)
     return redirect("home")
@@ -54,7 +63,7 @@ def resume_create(request):
             )
             return redirect("resume_edit", resume_id=resume.id)
         except Exception as e:
-            logger.error(f"Error creating resume: {e}")
+            logger.error("Error creating resume: %s", e)
             return render(request, "builder/resume_basics.html", {"error": "Failed to create resume"})
 
     return render(request, "builder/resume_basics.html")
@@ -87,7 +96,16 @@ def _validate_resume_data(title, full_name, email, phone):
 
 def resume_edit(request, resume_id: int):
     """Edit resume details and structured sections."""
-    resume = get_object_or_404(Resume, id=resume_id)
+    if request.method == "POST":
+        # A full save replaces every field, so pending autosaves are moot.
+        # Always start it from the database row, never a cached copy.
+        autosave_buffer.discard(resume_id)
+        resume = get_object_or_404(Resume, id=resume_id)
+    else:
+        # The form is what the next save starts from, so it must show the
+        # current row rather than another worker's cached copy.
+        autosave_buffer.flush(resume_id)
+        resume = get_resume_or_404(resume_id, fresh=True)
     errors = {}
 
     if request.method == "POST":
@@ -99,6 +117,17 @@ def resume_edit(request, resume_id: int):
 
         # Validate
         errors = _validate_resume_data(title, full_name, email, phone)
+        sections = {}
+        for section in SECTION_SCHEMAS:
+            raw = request.POST.get(f"{section}_json", "[]")
+            try:
+                sections[section] = validate_section(section, raw)
+            except ValidationError as e:
+                logger.warning(
+                    "Rejected %s for resume %s (%d chars): %s %r",
+                    section, resume_id, len(raw), e.messages[0], raw[:LOG_EXCERPT_CHARS],
+                )
+                errors[section] = e.messages[0]
 
         # If no errors, save the resume
         if not errors:
@@ -113,20 +142,18 @@ def resume_edit(request, resume_id: int):
                 resume.summary = (request.POST.get("summary") or "").strip()
 
                 # JSON sections
-                resume.education = _safe_json_list(request.POST.get("education_json", "[]"))
-                resume.experience = _safe_json_list(request.POST.get("experience_json", "[]"))
-                resume.projects = _safe_json_list(request.POST.get("projects_json", "[]"))
-                resume.skills = _safe_json_list(request.POST.get("skills_json", "[]"))
+                for section, entries in sections.items():
+                    setattr(resume, section, entries)
 
                 resume.save()
-                logger.info(f"Resume {resume_id} updated successfully")
+                logger.info("Resume %s updated successfully", resume_id)
 
                 if request.POST.get("action") == "preview":
                     return redirect("resume_preview", resume_id=resume.id)
 
                 return redirect("resume_edit", resume_id=resume.id)
             except Exception as e:
-                logger.error(f"Error saving resume {resume_id}: {e}")
+                logger.error("Error saving resume %s: %s", resume_id, e)
                 errors["__all__"] = "Failed to save resume. Please try again."
 
     return render(
@@ -143,272 +170,147 @@ def resume_edit(request, resume_id: int):
     )
 
 
+# Plain text fields the edit page may autosave.
+AUTOSAVE_TEXT_FIELDS = ("title", "full_name", "email", "phone", "location", "linkedin", "github", "summary")
+
+# Fields the edit page cannot leave blank (see _validate_resume_data).
+REQUIRED_FIELDS = ("title", "full_name", "email", "phone")
+
+
+def _autosave_skips(field, value):
+    """Return True for a value autosave must not store: blank but required, or too long."""
+    if field in REQUIRED_FIELDS and not value:
+        return True
+    max_length = Resume._meta.get_field(field).max_length
+    return max_length is not None and len(value) > max_length
+
+
+def resume_autosave(request, resume_id: int):
+    """Buffer changed fields from the edit page; they are written shortly after."""
+    if request.method != "POST":
+        return JsonResponse({"status": "error"}, status=405)
+    get_resume_or_404(resume_id)
+
+    changes, errors, skipped = {}, {}, []
+    for field in AUTOSAVE_TEXT_FIELDS:
+        if field not in request.POST:
+            continue
+        value = request.POST[field].strip()
+        # Values that are missing or cannot fit the column keep the stored
+        # value; the form reports missing ones when it is submitted.
+        if _autosave_skips(field, value):
+            skipped.append(field)
+            continue
+        changes[field] = value
+    for section in SECTION_SCHEMAS:
+        raw = request.POST.get(f"{section}_json")
+        if raw is None:
+            continue
+        try:
+            changes[section] = validate_section(section, raw)
+        except ValidationError as e:
+            errors[section] = e.messages[0]
+
+    if errors:
+        return JsonResponse({"status": "error", "errors": errors}, status=400)
+    if changes:
+        autosave_buffer.submit(resume_id, changes)
+    return JsonResponse({"status": "queued", "skipped": skipped}, status=202)
+
+
+@read_only_view
 def resume_preview(request, resume_id: int):
     """Preview resume in HTML."""
-    resume = get_object_or_404(Resume, id=resume_id)
+    # Just-written changes may not have reached the replica yet.
+    resume = get_resume_or_404(resume_id, fresh=autosave_buffer.flush(resume_id))
     return render(request, "builder/preview.html", {"resume": resume})
 
 
-def _get_contact_line(resume):
-    """Build contact line from email, phone, location."""
-    parts = [resume.email, resume.phone, resume.location]
-    return " | ".join([x for x in parts if x])
-
+def _export_response(resume, fmt):
+    """Render a resume with the given exporter and wrap it in a download response."""
+    exporter = get_exporter(fmt)
+    content = exporter.render(resume)
+    filename = f"{(resume.full_name or 'resume').replace(' ', '_')}.{exporter.EXTENSION}"
+    return HttpResponse(
+        content,
+        content_type=exporter.CONTENT_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
-def _get_links_line(resume):
-    """Build links line from LinkedIn and GitHub."""
-    parts = [resume.linkedin, resume.github]
-    return " | ".join([x for x in parts if x])
 
+@export_admission
+@read_only_view
+def export_resume(request, resume_id: int, fmt: str):
+    """Export resume in any registered format."""
+    if fmt not in get_backends():
+        raise Http404("Unknown export format")
+    # Just-written changes may not have reached the replica yet.
+    resume = get_resume_or_404(resume_id, fresh=autosave_buffer.flush(resume_id))
 
-def _wrap_text(text, width=95):
-    """
-    Wrap text to specified width, splitting on word boundaries.
-    
-    Args:
-        text: Text to wrap
-        width: Maximum line width
-        
-    Returns:
-        List of wrapped lines
-    """
-    words = (text or "").split()
-    lines, current_line = [], []
-    current_width = 0
-    
-    for word in words:
-        word_len = len(word)
-        space_len = 1 if current_line else 0
-        
-        if current_width + space_len + word_len <= width:
-            current_line.append(word)
-            current_width += space_len + word_len
-        else:
-            if current_line:
-                lines.append(" ".join(current_line))
-            current_line = [word]
-            current_width = word_len
-    
-    if current_line:
-        lines.append(" ".join(current_line))
-    
-    return lines
+    try:
+        response = _export_response(resume, fmt)
+        logger.info("%s exported for resume %s", fmt.upper(), resume_id)
+        return response
+    except Exception as e:
+        logger.error("Error exporting %s for resume %s: %s", fmt.upper(), resume_id, e)
+        return HttpResponse(f"Error generating {fmt.upper()}", status=500)
 
 
 def export_pdf(request, resume_id: int):
     """Export resume as PDF."""
-    resume = get_object_or_404(Resume, id=resume_id)
-
-    try:
-        buffer = io.BytesIO()
-        c = canvas.Canvas(buffer, pagesize=LETTER)
-        width, height = LETTER
-        y = height - 50
-
-        def write_line(text, size=11, gap=16):
-            """Write a line of text to the PDF."""
-            nonlocal y
-            c.setFont("Helvetica", size)
-            # Truncate long text to avoid overflow
-            display_text = (text or "")[:120]
-            c.drawString(50, y, display_text)
-            y -= gap
-            if y < 60:
-                c.showPage()
-                y = height - 50
-
-        # Header: Name
-        write_line(resume.full_name or "Unnamed", size=16, gap=22)
-        
-        # Contact info
-        contact = _get_contact_line(resume)
-        if contact:
-            write_line(contact, size=10, gap=14)
-
-        # Links
-        links = _get_links_line(resume)
-        if links:
-            write_line(links, size=10, gap=14)
-
-        # Summary
-        if resume.summary:
-            write_line("")
-            write_line("SUMMARY", size=12, gap=18)
-            for chunk in _wrap_text(resume.summary, 95):
-                write_line(chunk, size=10, gap=14)
-
-        # Education
-        if resume.education:
-            write_line("")
-            write_line("EDUCATION", size=12, gap=18)
-            for edu in resume.education:
-                degree = edu.get("degree", "")
-                institution = edu.get("institution", "")
-                dates = edu.get("dates", "")
-                details = edu.get("details", "")
-                
-                title = " — ".join([x for x in [degree, institution] if x])
-                write_line(f"{title}  {dates}".strip(), size=10, gap=14)
-                
-                if details:
-                    for chunk in _wrap_text(details, 95):
-                        write_line(f"  • {chunk}", size=10, gap=14)
-
-        # Experience
-        if resume.experience:
-            write_line("")
-            write_line("EXPERIENCE", size=12, gap=18)
-            for exp in resume.experience:
-                role = exp.get("role", "")
-                company = exp.get("company", "")
-                dates = exp.get("dates", "")
-                
-                title = " — ".join([x for x in [role, company] if x])
-                write_line(f"{title}  {dates}".strip(), size=10, gap=14)
-                
-                for bullet in (exp.get("bullets") or []):
-                    for chunk in _wrap_text(bullet, 95):
-                        write_line(f"  • {chunk}", size=10, gap=14)
-
-        # Projects
-        if resume.projects:
-            write_line("")
-            write_line("PROJECTS", size=12, gap=18)
-            for proj in resume.projects:
-                name = proj.get("name", "Project")
-                tech = proj.get("tech", "")
-                
-                write_line(f"{name}  {tech}".strip(), size=10, gap=14)
-                
-                for bullet in (proj.get("bullets") or []):
-                    for chunk in _wrap_text(bullet, 95):
-                        write_line(f"  • {chunk}", size=10, gap=14)
-
-        # Skills
-        if resume.skills:
-            write_line("")
-            write_line("SKILLS", size=12, gap=18)
-            skills_text = ", ".join([s for s in resume.skills if isinstance(s, str)])
-            write_line(skills_text[:110], size=10, gap=14)
-
-        c.save()
-        buffer.seek(0)
-        filename = f"{(resume.full_name or 'resume').replace(' ', '_')}.pdf"
-
-        logger.info(f"PDF exported for resume {resume_id}")
-
-        return HttpResponse(
-            buffer.getvalue(),
-            content_type="application/pdf",
-            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-        )
-    except Exception as e:
-        logger.error(f"Error exporting PDF for resume {resume_id}: {e}")
-        return HttpResponse("Error generating PDF", status=500)
+    return export_resume(request, resume_id, "pdf")
 
 
 def export_docx(request, resume_id: int):
     """Export resume as DOCX."""
-    resume = get_object_or_404(Resume, id=resume_id)
-
+    return export_resume(request, resume_id, "docx")
+
+
+def _parse_ids(raw):
+    """Parse a comma-separated list of resume ids, keeping order and dropping repeats."""
+    ids = []
+    for part in (raw or "").split(","):
+        part = part.strip()
+        if part.isdigit() and int(part) not in ids:
+            ids.append(int(part))
+    return ids
+
+
+@read_only_view
+def export_packet(request):
+    """Export several resumes as one PDF with a bookmark per candidate."""
+    # Validate before admission, which a large packet may fill entirely.
+    ids = _parse_ids(request.GET.get("ids") or request.POST.get("ids"))
+    if not ids:
+        return HttpResponse("No resume ids given", status=400)
+    max_resumes = getattr(settings, "PACKET_MAX_RESUMES", 500)
+    if len(ids) > max_resumes:
+        return HttpResponse(f"At most {max_resumes} resumes per packet", status=400)
+
+    flushed = [autosave_buffer.flush(resume_id) for resume_id in ids]
+    # Just-written changes may not have reached the replica yet.
+    queryset = Resume.objects.using("default") if any(flushed) else Resume.objects
+    found = queryset.in_bulk(ids)
+    resumes = [found[resume_id] for resume_id in ids if resume_id in found]
+    if not resumes:
+        raise Http404("No matching resumes")
+    return _packet_response(request, resumes)
+
+
+@export_admission(weight=lambda request, resumes: len(resumes))
+def _packet_response(request, resumes):
+    """Render the packet once admitted, taking one export slot per resume."""
     try:
-        doc = Document()
-        doc.add_heading(resume.full_name or "Unnamed", level=0)
-
-        # Contact info
-        contact = _get_contact_line(resume)
-        if contact:
-            doc.add_paragraph(contact)
-
-        # Links
-        links = _get_links_line(resume)
-        if links:
-            doc.add_paragraph(links)
-
-        # Summary
-        if resume.summary:
-            doc.add_heading("Summary", level=1)
-            doc.add_paragraph(resume.summary)
-
-        # Education
-        if resume.education:
-            doc.add_heading("Education", level=1)
-            for edu in resume.education:
-                degree = edu.get("degree", "")
-                institution = edu.get("institution", "")
-                dates = edu.get("dates", "")
-                details = edu.get("details", "")
-                
-                title = " — ".join([x for x in [degree, institution, dates] if x])
-                doc.add_paragraph(title, style="List Bullet")
-                
-                if details:
-                    doc.add_paragraph(details)
-
-        # Experience
-        if resume.experience:
-            doc.add_heading("Experience", level=1)
-            for exp in resume.experience:
-                role = exp.get("role", "")
-                company = exp.get("company", "")
-                dates = exp.get("dates", "")
-                
-                title = " — ".join([x for x in [role, company, dates] if x])
-                doc.add_paragraph(title, style="List Bullet")
-                
-                for bullet in (exp.get("bullets") or []):
-                    doc.add_paragraph(bullet, style="List Bullet 2")
-
-        # Projects
-        if resume.projects:
-            doc.add_heading("Projects", level=1)
-            for proj in resume.projects:
-                name = proj.get("name", "")
-                tech = proj.get("tech", "")
-                
-                title = " — ".join([x for x in [name, tech] if x])
-                doc.add_paragraph(title, style="List Bullet")
-                
-                for bullet in (proj.get("bullets") or []):
-                    doc.add_paragraph(bullet, style="List Bullet 2")
-
-        # Skills
-        if resume.skills:
-            doc.add_heading("Skills", level=1)
-            skills_text = ", ".join([s for s in resume.skills if isinstance(s, str)])
-            doc.add_paragraph(skills_text)
-
-        f = io.BytesIO()
-        doc.save(f)
-        f.seek(0)
-        filename = f"{(resume.full_name or 'resume').replace(' ', '_')}.docx"
-
-        logger.info(f"DOCX exported for resume {resume_id}")
-
-        return HttpResponse(
-            f.getvalue(),
-            content_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-        )
+        out = tempfile.TemporaryFile()
+        render_packet(resumes, out)
+        out.seek(0)
     except Exception as e:
-        logger.error(f"Error exporting DOCX for resume {resume_id}: {e}")
-        return HttpResponse("Error generating DOCX", status=500)
-
-
-def _safe_json_list(raw: str):
-    """
-    Safely parse JSON list from string.
-    
-    Args:
-        raw: Raw JSON string
-        
-    Returns:
-        List if valid JSON, empty list otherwise
-    """
-    try:
-        val = json.loads(raw or "[]")
-        return val if isinstance(val, list) else []
-    except (json.JSONDecodeError, TypeError):
-        logger.warning(f"Failed to parse JSON: {raw}")
-        return []
-
+        logger.error("Error exporting packet for %d resumes: %s", len(resumes), e)
+        return HttpResponse("Error generating PDF packet", status=500)
+
+    return FileResponse(
+        out,
+        as_attachment=True,
+        filename="resume_packet.pdf",
+        content_type="application/pdf",
+    )
@@ -0,0 +1,101 @@
+"""
+Logging handlers that keep disk I/O off the request thread.
+"""
+
+import logging
+import os
+import queue
+import weakref
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# Handlers whose writer thread must be restarted in forked children.
+_handlers = weakref.WeakSet()
+
+
+def _restart_in_child():
+    for handler in list(_handlers):
+        handler._start()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_in_child)
+
+
+class QueuedRotatingFileHandler(QueueHandler):
+    """
+    Hand records to a background thread that writes a size-rotated log file.
+
+    The calling thread merges the message arguments (and any traceback) into
+    the record, so it logs the values as they were and holds no references to
+    them, then puts it on a bounded in-memory queue. Applying the file format,
+    writing and rotation happen in the listener thread, so a slow disk never
+    adds request latency. If the queue is full the record is dropped and
+    counted rather than blocking the caller; the count is logged as soon as
+    the queue has room again.
+
+    Threads do not survive ``fork()``, so a forked child (e.g. a pre-fork
+    server worker) gets its own queue, writer thread and file handle. Size
+    rotation is only safe with one writing process per file: servers with
+    several worker processes should put ``{pid}`` in ``filename`` so each
+    process writes and rotates its own file.
+    """
+
+    def __init__(self, filename, max_bytes=10 * 1024 * 1024, backup_count=5,
+                 queue_size=10000, encoding='utf-8'):
+        super().__init__(queue.Queue(maxsize=queue_size))
+        self.filename = str(filename)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.queue_size = queue_size
+        self.encoding = encoding
+        self.dropped = 0
+        self._unreported = 0
+        self.target = None
+        self.listener = None
+        self._start()
+        _handlers.add(self)
+
+    def _start(self):
+        """Create the queue, file handler and writer thread for this process."""
+        formatter = self.target.formatter if self.target is not None else None
+        self.queue = queue.Queue(maxsize=self.queue_size)
+        self.target = RotatingFileHandler(
+            self.filename.format(pid=os.getpid()),
+            maxBytes=self.max_bytes,
+            backupCount=self.backup_count,
+            encoding=self.encoding,
+            delay=True,
+        )
+        self.target.setFormatter(formatter)
+        self.listener = QueueListener(self.queue, self.target, respect_handler_level=True)
+        self.listener.start()
+
+    def setFormatter(self, fmt):
+        # The writer thread formats records, so the formatter belongs to it.
+        self.target.setFormatter(fmt)
+
+    def _dropped_record(self):
+        return logging.LogRecord(
+            __name__, logging.WARNING, __file__, 0,
+            'Log queue full, dropped %d records', (self._unreported,), None,
+        )
+
+    def enqueue(self, record):
+        try:
+            if self._unreported:
+                self.queue.put_nowait(self._dropped_record())
+                self._unreported = 0
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            self._unreported += 1
+
+    def close(self):
+        _handlers.discard(self)
+        if self.listener._thread is not None:
+            self.listener.stop()
+        if self._unreported:
+            self.target.handle(self._dropped_record())
+            self._unreported = 0
+        self.target.close()
+        super().close()
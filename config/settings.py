@@ -93,13 +93,57 @@ WSGI_APPLICATION = 'config.wsgi.application'
 
 # Database
 
+# SQLite runs every statement in SQLITE_INIT_COMMAND when a connection is
+# opened. WAL lets readers proceed while a save is being written, and the
+# cache/mmap pragmas keep hot pages in memory instead of re-reading the file.
+SQLITE_INIT_COMMAND = ';'.join([
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA cache_size=-{}'.format(os.environ.get('SQLITE_CACHE_KIB', '20000')),
+    'PRAGMA mmap_size={}'.format(os.environ.get('SQLITE_MMAP_SIZE', str(128 * 1024 * 1024))),
+    'PRAGMA temp_store=MEMORY',
+])
+
+SQLITE_OPTIONS = {
+    'init_command': SQLITE_INIT_COMMAND,
+    # Take the write lock up front so concurrent saves wait on the busy
+    # timeout instead of failing with "database is locked" mid-transaction.
+    'transaction_mode': 'IMMEDIATE',
+    'timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT', '20')),
+}
+
+# Keep connections open between requests instead of reconnecting each time.
+CONN_MAX_AGE = int(os.environ.get('CONN_MAX_AGE', '60'))
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'NAME': os.environ.get('DATABASE_NAME', BASE_DIR / 'db.sqlite3'),
+        'OPTIONS': SQLITE_OPTIONS,
+        'CONN_MAX_AGE': CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+# Optional read replica. Read-only views (see builder.routers) are served from
+# this alias; everything else, including all writes, goes to 'default'.
+DATABASE_REPLICA_NAME = os.environ.get('DATABASE_REPLICA_NAME')
+if DATABASE_REPLICA_NAME:
+    DATABASES['replica'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': DATABASE_REPLICA_NAME,
+        'OPTIONS': SQLITE_OPTIONS,
+        'CONN_MAX_AGE': CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': True,
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['builder.routers.ReplicaRouter']
+
+# Resume summary and section values shorter than this many bytes are stored
+# uncompressed; compressing them would cost more CPU than it saves space.
+RESUME_COMPRESS_THRESHOLD = int(os.environ.get('RESUME_COMPRESS_THRESHOLD', '256'))
+
 
 # Password validation
 
@@ -135,6 +179,90 @@ STATIC_URL = '/static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 STATICFILES_DIRS = [BASE_DIR / 'static']
 
+# In production, collectstatic writes content-hashed, minified and
+# pre-compressed assets (see builder.staticfiles). Development keeps the
+# plain storage so runserver works without running collectstatic first.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': (
+            'django.contrib.staticfiles.storage.StaticFilesStorage' if DEBUG
+            else 'builder.staticfiles.CompressedManifestStaticFilesStorage'
+        ),
+    },
+}
+
+# Serve STATIC_ROOT from Django (with gzip/brotli negotiation) when there is
+# no front-end web server doing it.
+SERVE_STATIC = os.environ.get('SERVE_STATIC', str(not DEBUG)).lower() == 'true'
+
+
+# Request bodies larger than this are rejected before any form or JSON
+# parsing. A full resume edit is normally a few kilobytes.
+DATA_UPLOAD_MAX_MEMORY_SIZE = int(os.environ.get('DATA_UPLOAD_MAX_MEMORY_SIZE', 512 * 1024))
+
+# Limits on structured resume sections (see builder.validation).
+RESUME_MAX_SECTION_BYTES = 64 * 1024
+RESUME_MAX_ENTRIES = 50
+RESUME_MAX_BULLETS = 20
+RESUME_MAX_LINE_CHARS = 200
+RESUME_MAX_TEXT_CHARS = 2000
+
+# Autosave write-behind buffer (see builder.autosave): a resume is written
+# once edits pause for AUTOSAVE_DEBOUNCE seconds, and at most
+# AUTOSAVE_MAX_DELAY seconds after its first unsaved edit.
+AUTOSAVE_DEBOUNCE = float(os.environ.get('AUTOSAVE_DEBOUNCE', '2'))
+AUTOSAVE_MAX_DELAY = float(os.environ.get('AUTOSAVE_MAX_DELAY', '15'))
+# Failed autosave writes are retried this many times before being dropped.
+AUTOSAVE_MAX_RETRIES = int(os.environ.get('AUTOSAVE_MAX_RETRIES', '5'))
+
+# Read-through Resume cache (see builder.resume_cache). RESUME_CACHE_SIZE
+# bounds the per-process LRU (0 disables it); RESUME_CACHE_TTL is how long
+# other processes may keep serving a copy after a save. Set
+# RESUME_CACHE_ALIAS to a CACHES alias to share entries between processes.
+RESUME_CACHE_SIZE = int(os.environ.get('RESUME_CACHE_SIZE', '256'))
+RESUME_CACHE_TTL = float(os.environ.get('RESUME_CACHE_TTL', '2'))
+RESUME_CACHE_ALIAS = os.environ.get('RESUME_CACHE_ALIAS') or None
+
+# Export admission control (see builder.throttling). Limits are per worker
+# process except the rate limit, which is counted in the default cache.
+# The CPUs are shared between WEB_CONCURRENCY web worker processes (the
+# variable gunicorn reads), so each process renders with its share of them.
+WEB_CONCURRENCY = int(os.environ.get('WEB_CONCURRENCY', '1'))
+RENDER_CPU_BUDGET = max(1, (os.cpu_count() or 2) // WEB_CONCURRENCY)
+EXPORT_MAX_CONCURRENCY = int(os.environ.get('EXPORT_MAX_CONCURRENCY', RENDER_CPU_BUDGET))
+EXPORT_MAX_QUEUE = int(os.environ.get('EXPORT_MAX_QUEUE', '8'))
+EXPORT_QUEUE_TIMEOUT = float(os.environ.get('EXPORT_QUEUE_TIMEOUT', '5'))
+EXPORT_RATE_LIMIT = int(os.environ.get('EXPORT_RATE_LIMIT', '10'))
+EXPORT_RATE_WINDOW = int(os.environ.get('EXPORT_RATE_WINDOW', '60'))
+
+# Multi-resume PDF packets (see builder.packets): worker processes used to
+# render them (default: this process's RENDER_CPU_BUDGET) and the largest
+# packet accepted.
+PACKET_WORKERS = int(os.environ.get('PACKET_WORKERS', '0')) or RENDER_CPU_BUDGET
+PACKET_MAX_RESUMES = int(os.environ.get('PACKET_MAX_RESUMES', '500'))
+
+# Import all export backends at startup instead of on first export. Enable
+# together with gunicorn --preload so workers inherit the loaded modules.
+EXPORT_PRELOAD = os.environ.get('EXPORT_PRELOAD', 'False').lower() == 'true'
+
+# Directories scanned for .ttf files used by PDF export for non-Latin text.
+EXPORT_FONT_DIRS = [BASE_DIR / 'fonts'] + [
+    Path(p) for p in os.environ.get('EXPORT_FONT_DIRS', '').split(os.pathsep) if p
+]
+# System fonts used after those, when they exist. An empty
+# EXPORT_FALLBACK_FONTS environment variable turns the fallback off.
+EXPORT_FALLBACK_FONTS = [
+    Path(p) for p in os.environ.get('EXPORT_FALLBACK_FONTS', os.pathsep.join([
+        '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+        '/usr/share/fonts/TTF/DejaVuSans.ttf',
+        '/usr/share/fonts/dejavu/DejaVuSans.ttf',
+        '/usr/share/fonts/truetype/noto/NotoSans-Regular.ttf',
+    ])).split(os.pathsep) if p
+]
+
 
 # Default primary key field type
 
@@ -169,10 +297,19 @@ LOGGING = {
             'class': 'logging.StreamHandler',
             'formatter': 'simple',
         },
+        # Written by a background thread; see config.log_handlers. Rotation
+        # assumes one process per file, so multi-process servers should set
+        # LOG_FILE_PER_PROCESS to give each worker its own speak2cv.<pid>.log.
         'file': {
             'level': 'INFO',
-            'class': 'logging.FileHandler',
-            'filename': BASE_DIR / 'logs' / 'speak2cv.log',
+            '()': 'config.log_handlers.QueuedRotatingFileHandler',
+            'filename': str(BASE_DIR / 'logs' / (
+                'speak2cv.{pid}.log'
+                if os.environ.get('LOG_FILE_PER_PROCESS', 'False').lower() == 'true'
+                else 'speak2cv.log'
+            )),
+            'max_bytes': int(os.environ.get('LOG_MAX_BYTES', 10 * 1024 * 1024)),
+            'backup_count': int(os.environ.get('LOG_BACKUP_COUNT', '5')),
             'formatter': 'verbose',
         },
     },
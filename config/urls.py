@@ -1,9 +1,17 @@
+from django.conf import settings
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.views.generic import RedirectView
 
+from builder.staticfiles import serve_static
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("builder/", include("builder.urls")),
     path("", RedirectView.as_view(url="builder/", permanent=False)),
 ]
+
+if settings.SERVE_STATIC:
+    urlpatterns.append(
+        re_path(rf"^{settings.STATIC_URL.lstrip('/')}(?P<path>.*)$", serve_static)
+    )
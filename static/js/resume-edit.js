@@ -251,6 +251,54 @@ document.getElementById("resumeForm").addEventListener("submit", () => {
   document.getElementById("skills_json").value = JSON.stringify(skills);
 });
 
+// ===================== Autosave =====================
+
+// Edits are sent in the background shortly after typing or dictation pauses.
+// The server buffers them and writes the resume once edits settle.
+const AUTOSAVE_DELAY_MS = 1500;
+let autosaveTimer = null;
+let autosaveInFlight = null;
+
+function sendAutosave() {
+  const form = document.getElementById("resumeForm");
+  if (!form || !form.dataset.autosaveUrl) return;
+
+  updateHiddenJsonFields();
+  document.getElementById("skills_json").value = JSON.stringify(
+    skillsText.value
+      .split("\n")
+      .map((s) => s.trim())
+      .filter(Boolean)
+  );
+
+  autosaveInFlight = fetch(form.dataset.autosaveUrl, {
+    method: "POST",
+    body: new FormData(form),
+    credentials: "same-origin",
+  })
+    .catch(() => { })
+    .finally(() => {
+      autosaveInFlight = null;
+    });
+}
+
+function scheduleAutosave() {
+  clearTimeout(autosaveTimer);
+  autosaveTimer = setTimeout(sendAutosave, AUTOSAVE_DELAY_MS);
+}
+
+document.getElementById("resumeForm").addEventListener("input", scheduleAutosave);
+document.getElementById("resumeForm").addEventListener("submit", (e) => {
+  clearTimeout(autosaveTimer);
+  // Let an autosave already on its way reach the server first, so the server
+  // sees it as older than this save and drops it instead of writing it later.
+  if (autosaveInFlight) {
+    e.preventDefault();
+    const submitter = e.submitter;
+    autosaveInFlight.then(() => e.target.requestSubmit(submitter));
+  }
+});
+
 // ===================== Initial Render =====================
 
 renderEducation();
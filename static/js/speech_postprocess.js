@@ -6,7 +6,7 @@
  * formatting for resume text fields.
  * 
  * Usage:
- *   import { postProcessSpeech } from './speech_postprocess.js';
+ *   Import postProcessSpeech from this module, then:
  *   const cleanText = postProcessSpeech("hello comma world period");
  *   // Returns: "hello, world."
  */